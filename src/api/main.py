@@ -1,36 +1,110 @@
-from fastapi import FastAPI, Request, HTTPException
+from fastapi import FastAPI, Request, Response
+from fastapi.utils import is_body_allowed_for_status_code
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from src.api.schemas.chat import ChatRequest, ChatResponse, EntityExtractionRequest, EntityExtractionResponse, ValidationRequest, ValidationResponse
-from src.api.routers.system import router as system_router
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.middleware.gzip import GZipMiddleware
+from src.api.routers.system import router as system_router, close_pg_pool
 from src.api.routers.chat import router as chat_router
 from src.api.routers.extract import router as extract_router
 from src.api.routers.validate import router as validate_router
 from src.api.routers.sessions import router as sessions_router
 from src.api.routers.consultations import router as consultations_router
-# Imports moved to container for centralized management
-from src.core.validation.normalizers.data_normalizer import DataNormalizer
+from src.api.middleware.request_logging import RequestBodyLoggingMiddleware
+from src.api.responses import ORJSONResponse
 from src.core.logging.logger_factory import get_logger
 from src.core.config import get_settings
-from src.core.database import create_tables
+from src.core.database import create_tables, warm_up_pool
 # ConsultationService imported via container
-from datetime import datetime
-from typing import Dict, Any, Optional
-import uuid
-import json
+from src.core.openai_client import OpenAIClient, get_http_client
+from src.core.clock import start_clock, stop_clock
+from contextlib import asynccontextmanager, suppress
+import asyncio
+import anyio
+import orjson
+from starlette.concurrency import run_in_threadpool
 
-# Get centralized settings
+# Get centralized settings (single cached instance, fetched once per process)
 settings = get_settings()
 
 # Setup logging with configured log level
 logger = get_logger(__name__)
 
-# Initialize unified data normalizer
-data_normalizer = DataNormalizer()
+# Initialize services using ServiceContainer
+from src.core.container import ServiceContainer
+
+service_container = ServiceContainer()
+
+
+async def periodic_session_cleanup(interval: float) -> None:
+    """Evict expired sessions in the background (only due heap entries are visited)"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            removed = service_container.get_service('session_service').cleanup_old_sessions()
+            if removed:
+                logger.info(f"Limpeza periódica removeu {removed} sessões expiradas")
+        except Exception as e:
+            logger.error(f"Erro na limpeza periódica de sessões: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Manage shared resources (HTTP pool, services, database) across the app lifecycle"""
+    # Sync DB calls are offloaded to this pool; anyio's default is 40 threads
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    
+    # Single pooled HTTP client reused by every OpenAI call
+    app.state.http = get_http_client()
+    start_clock()
+    
+    try:
+        if not service_container.is_initialized('openai_client'):
+            service_container.register_service('openai_client', OpenAIClient(http_client=app.state.http))
+        service_container.initialize_services()
+        logger.info("ServiceContainer inicializado com todos os servicos")
+    except Exception as e:
+        logger.error(f"Erro ao inicializar ServiceContainer: {e}")
+    
+    try:
+        logger.info("Creating database tables...")
+        # Blocking DDL runs in the threadpool so it does not stall the event loop
+        await run_in_threadpool(create_tables)
+        logger.info("Database tables created successfully")
+    except Exception as e:
+        logger.error(f"Failed to create database tables: {e}")
+        # Don't fail startup - log and continue
+    
+    if settings.DB_POOL_PREWARM:
+        try:
+            await run_in_threadpool(warm_up_pool, settings.DB_POOL_PREWARM)
+        except Exception as e:
+            logger.warning(f"Database pool warm-up skipped: {e}")
+    
+    if app.openapi_url:
+        # Build the schema now instead of on the first /docs request
+        app.openapi()
+    
+    cleanup_task = asyncio.create_task(periodic_session_cleanup(settings.SESSION_CLEANUP_INTERVAL))
+    
+    yield
+    
+    cleanup_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await cleanup_task
+    await stop_clock()
+    await close_pg_pool()
+    await service_container.aclose()
+
 
 app = FastAPI(
     title=settings.APP_NAME,
-    version=settings.APP_VERSION
+    version=settings.APP_VERSION,
+    default_response_class=ORJSONResponse,
+    # Interactive docs and schema generation are development-only
+    docs_url=None if settings.is_production else "/docs",
+    redoc_url=None if settings.is_production else "/redoc",
+    openapi_url=None if settings.is_production else "/openapi.json",
+    lifespan=lifespan
 )
 
 logger.info("✅ FastAPI app criada - main.py executando")
@@ -43,51 +117,79 @@ app.include_router(validate_router)
 app.include_router(sessions_router)
 app.include_router(consultations_router)
 
+# Compress large JSON bodies; added before CORS so CORS stays the outer layer
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.GZIP_MINIMUM_SIZE,
+    compresslevel=settings.GZIP_COMPRESS_LEVEL
+)
+
 # Configure CORS middleware with centralized settings
-settings = get_settings()
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.ALLOWED_ORIGINS,
+    # Origin checks are a set lookup instead of a scan over the configured tuple
+    allow_origins=frozenset(settings.ALLOWED_ORIGINS),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists are matched against precomputed sets; "*" reflects every preflight
+    allow_methods=("GET", "POST", "DELETE", "OPTIONS"),
+    allow_headers=("content-type", "authorization", "x-request-id"),
+    # Browsers cache the preflight for a day instead of sending OPTIONS per call
+    max_age=86400,
 )
 
-# Initialize services using ServiceContainer
-from src.core.container import (
-    ServiceContainer, 
-    get_openai_client, 
-    get_entity_extractor, 
-    get_consultation_service
+# Body logging reads every request stream; only enable it while debugging
+if settings.DEBUG:
+    app.add_middleware(RequestBodyLoggingMiddleware)
+
+
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> Response:
+    """Render HTTPException (including router 404/405) with orjson instead of stdlib json"""
+    headers = getattr(exc, "headers", None)
+    if not is_body_allowed_for_status_code(exc.status_code):
+        return Response(status_code=exc.status_code, headers=headers)
+    return ORJSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=headers)
+
+
+# Serialized once; unexpected errors never echo exception text to the client
+_INTERNAL_ERROR_BODY = orjson.dumps({"detail": "Internal server error"})
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception) -> Response:
+    """Single 500 mapping for unexpected errors, so routers need no catch-all try/except"""
+    logger.exception("Erro inesperado em %s %s", request.method, request.url.path)
+    return Response(content=_INTERNAL_ERROR_BODY, media_type="application/json", status_code=500)
+
+
+# Static payload serialized once; load balancer probes hit this endpoint constantly
+_ROOT_RESPONSE = Response(
+    content=orjson.dumps({
+        "message": "Data Structuring Agent API",
+        "status": "running"
+    }),
+    media_type="application/json"
 )
-from src.core.reasoning.reasoning_coordinator import ReasoningCoordinator
-
-# Initialize service container
-try:
-    service_container = ServiceContainer()
-    service_container.initialize_services()
-    logger.info("ServiceContainer inicializado com todos os servicos")
-except Exception as e:
-    logger.error(f"Erro ao inicializar ServiceContainer: {e}")
-    service_container = None
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database tables on startup"""
-    try:
-        logger.info("Creating database tables...")
-        create_tables()
-        logger.info("Database tables created successfully")
-    except Exception as e:
-        logger.error(f"Failed to create database tables: {e}")
-        # Don't fail startup - log and continue
 
 
 @app.get("/")
 async def root():
     """Root endpoint"""
-    logger.info("Root endpoint acessado")
-    return {
-        "message": "Data Structuring Agent API",
-        "status": "running"
-    }
\ No newline at end of file
+    return _ROOT_RESPONSE
+
+
+if __name__ == "__main__":
+    import uvicorn
+    
+    # One process per core on uvloop + httptools; access logs are off because
+    # every request line would otherwise go through the logging pipeline
+    uvicorn.run(
+        "src.api.main:app",
+        host=settings.HOST,
+        port=settings.PORT,
+        workers=settings.WORKERS,
+        loop="uvloop",
+        http="httptools",
+        log_level="warning",
+        access_log=False
+    )
@@ -0,0 +1,89 @@
+"""
+Request body logging for debugging.
+
+Pure ASGI middleware: it buffers the body once, logs a truncated view and
+replays it downstream, without BaseHTTPMiddleware's per-request task group
+or Request/Response wrappers.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Bytes of the body included in each log line
+BODY_LOG_LIMIT = 200
+
+
+def _content_length(scope) -> int:
+    """Declared body size from the Content-Length header (0 if absent or invalid)."""
+    for name, value in scope["headers"]:
+        if name == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return 0
+    return 0
+
+
+async def _read_remaining(receive, first_chunk: bytes, expected: int):
+    """
+    Read the rest of a multi-message body into a buffer pre-sized from
+    Content-Length, so chunks are copied in place instead of being
+    collected and joined. Returns None if the client disconnects.
+    """
+    buffer = bytearray(max(expected, len(first_chunk)))
+    offset = len(first_chunk)
+    buffer[:offset] = first_chunk
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message["type"] != "http.request":
+            return None
+        chunk = message.get("body", b"")
+        # Slice assignment grows the buffer if the header understated the size
+        buffer[offset:offset + len(chunk)] = chunk
+        offset += len(chunk)
+        more_body = message.get("more_body", False)
+    del buffer[offset:]
+    return bytes(buffer)
+
+
+class RequestBodyLoggingMiddleware:
+    """Log method, path and the first bytes of every request body (DEBUG only)."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        message = await receive()
+        body = message.get("body", b"") if message["type"] == "http.request" else None
+        if body is not None and message.get("more_body", False):
+            body = await _read_remaining(receive, body, _content_length(scope))
+        if body is None:
+            # Client went away before sending the full body
+            await self.app(scope, receive, send)
+            return
+
+        logger.debug(
+            "%s %s body (%d bytes): %r",
+            scope["method"],
+            scope["path"],
+            len(body),
+            body[:BODY_LOG_LIMIT]
+        )
+
+        replayed = False
+
+        async def replay():
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            # After the body, defer to the real channel (e.g. http.disconnect)
+            return await receive()
+
+        await self.app(scope, replay, send)
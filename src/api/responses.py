@@ -0,0 +1,34 @@
+"""
+Response classes shared by the API.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered by orjson.
+    
+    Unlike fastapi.responses.ORJSONResponse, values orjson cannot encode
+    natively (Decimal, custom objects) fall back to str() instead of
+    raising, so handlers can return ORM-derived dicts as they are.
+    """
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+def model_response(model: BaseModel, status_code: int = 200) -> Response:
+    """
+    Render a response model with pydantic's own JSON serializer.
+    
+    Returning a Response skips FastAPI's response_model re-validation and
+    jsonable_encoder walk; the decorator's response_model still documents
+    the schema in OpenAPI.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json", status_code=status_code)
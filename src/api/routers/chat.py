@@ -1,38 +1,100 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from src.api.request_body import json_body, json_body_openapi
+from src.api.responses import model_response
 from src.api.schemas.chat import ChatRequest, ChatResponse
-from datetime import datetime
-from typing import Dict, Any
-import uuid
-import json
+import asyncio
 import logging
+import httpx
+import orjson
+from typing import Optional
 
 from src.core.container import get_chat_service
 from src.core.config import get_settings
+from src.core.id_pool import new_id
+from src.core import clock
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-@router.post("/chat/message", response_model=ChatResponse)
-async def chat_message(chat_request: ChatRequest) -> ChatResponse:
+settings = get_settings()
+
+def _error_payload(message: str) -> dict:
+    """ChatResponse-shaped error fields built once at import time; session_id/timestamp are filled per request."""
+    return {
+        "response": message,
+        "session_id": None,
+        "timestamp": None,
+        "action": "error",
+        "extracted_data": {},
+        "confidence": 0.0,
+        "next_questions": [],
+        "consultation_id": None,
+        "persistence_status": "not_applicable"
+    }
+
+
+# Payload served while ChatService is unavailable (hot path during an outage)
+_UNAVAILABLE_PAYLOAD = _error_payload("Desculpe, o serviço de chat está indisponível no momento. Tente novamente em instantes.")
+
+# Prebuilt (status, payload) per exception family; failures never format per-request strings
+_ERROR_RESPONSES = {
+    TimeoutError: (504, _error_payload("O serviço demorou demais para responder. Tente novamente em instantes.")),
+    httpx.HTTPError: (502, _error_payload("Falha de comunicação com o serviço de IA. Tente novamente em instantes.")),
+    Exception: (500, _error_payload("Ocorreu um erro interno ao processar sua mensagem.")),
+}
+
+
+def _render_error(payload: dict, status_code: int, session_id: Optional[str]) -> Response:
+    """Render an error payload with the caller's session and the current time, so it matches ChatResponse."""
+    body = orjson.dumps({**payload, "session_id": session_id or new_id(), "timestamp": clock.utcnow()})
+    return Response(content=body, media_type="application/json", status_code=status_code)
+
+
+def _unavailable_response(session_id: Optional[str]) -> Response:
+    """503 returned while ChatService cannot be resolved."""
+    return _render_error(_UNAVAILABLE_PAYLOAD, 503, session_id)
+
+
+def _error_response(exc: Exception, session_id: Optional[str]) -> Response:
+    """Return the prebuilt response for the closest known base class of exc."""
+    for cls in type(exc).__mro__:
+        entry = _ERROR_RESPONSES.get(cls)
+        if entry is not None:
+            status_code, payload = entry
+            return _render_error(payload, status_code, session_id)
+    status_code, payload = _ERROR_RESPONSES[Exception]
+    return _render_error(payload, status_code, session_id)
+
+@router.post("/chat/message", response_model=ChatResponse, openapi_extra=json_body_openapi(ChatRequest))
+async def chat_message(chat_request: ChatRequest = Depends(json_body(ChatRequest))) -> Response:
     """Process chat message using ChatService."""
-    logger.info("=== INÍCIO: Endpoint /chat/message com ChatService ===")
+    logger.debug("=== INÍCIO: Endpoint /chat/message com ChatService ===")
     
     try:
-        logger.info(f"ChatRequest recebido: message='{chat_request.message[:50]}...'")
+        logger.debug("ChatRequest recebido: message='%.50s...'", chat_request.message)
         
         # Get session ID from request
         session_id = chat_request.session_id
         
         # Process message using ChatService
-        chat_service = get_chat_service()
+        try:
+            chat_service = get_chat_service()
+        except Exception as e:
+            logger.error("ChatService indisponível: %s", e)
+            chat_service = None
+        if chat_service is None:
+            return _unavailable_response(session_id)
+        
+        # ChatService bounds the LLM stage with CHAT_REQUEST_TIMEOUT; its
+        # TimeoutError maps to the prebuilt 504 below
         result = await chat_service.process_message(chat_request.message, session_id)
         
-        # Convert result to ChatResponse
-        response = ChatResponse(
+        # Fields come from ChatService's own result dict; skip re-validating them
+        response = ChatResponse.model_construct(
             response=result.get("response", "Desculpe, não consegui processar sua mensagem."),
-            session_id=result.get("session_id", str(uuid.uuid4())),
-            timestamp=result.get("timestamp", datetime.utcnow()),
+            session_id=result.get("session_id") or new_id(),
+            timestamp=result.get("timestamp") or clock.utcnow(),
             action=result.get("action", "unknown"),
             extracted_data=result.get("extracted_data", {}),
             confidence=result.get("confidence", 0.0),
@@ -41,17 +103,39 @@ async def chat_message(chat_request: ChatRequest) -> ChatResponse:
             persistence_status=result.get("persistence_status", "not_applicable")
         )
         
-        logger.info("=== FIM: Endpoint /chat/message - Sucesso ===")
-        return response
+        logger.debug("=== FIM: Endpoint /chat/message - Sucesso ===")
+        return model_response(response)
         
     except HTTPException:
         logger.error("=== FIM: Endpoint /chat/message - HTTPException ===")
         raise
     except Exception as e:
-        logger.error(f"Erro inesperado ao processar chat message: {e}")
+        logger.exception("Erro inesperado ao processar chat message")
         logger.error("=== FIM: Endpoint /chat/message - Erro ===")
-        return ChatResponse(
-            response=f"Ocorreu um erro ao processar sua mensagem: {str(e)}",
-            session_id=str(uuid.uuid4()),
-            timestamp=datetime.utcnow()
-        ) 
\ No newline at end of file
+        return _error_response(e, chat_request.session_id) 
+
+_SESSION_NOT_FOUND_BODY = orjson.dumps({"detail": "Session not found"})
+
+
+@router.get("/chat/persist-status/{session_id}")
+async def chat_persist_status(session_id: str) -> Response:
+    """Outcome of the session's latest consultation persistence (waits while it is pending)."""
+    try:
+        chat_service = get_chat_service()
+    except Exception as e:
+        logger.error("ChatService indisponível: %s", e)
+        chat_service = None
+    if chat_service is None:
+        return _unavailable_response(session_id)
+    
+    try:
+        status = await asyncio.wait_for(
+            chat_service.get_persistence_status(session_id),
+            timeout=settings.CHAT_REQUEST_TIMEOUT
+        )
+    except Exception as e:
+        logger.exception("Erro ao consultar status de persistência")
+        return _error_response(e, session_id)
+    if status is None:
+        return Response(content=_SESSION_NOT_FOUND_BODY, media_type="application/json", status_code=404)
+    return Response(content=orjson.dumps({"session_id": session_id, **status}), media_type="application/json")
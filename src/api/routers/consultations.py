@@ -1,53 +1,119 @@
-from fastapi import APIRouter, HTTPException
-from datetime import datetime
+from fastapi import APIRouter, Query, Request, Response
+from fastapi.responses import StreamingResponse
+import asyncio
+import gzip
 import logging
+import time
+import orjson
+from typing import Iterator, Literal, Optional, Tuple
+from starlette.concurrency import run_in_threadpool
+from src.core import clock
+from src.core.config import get_settings
 from src.core.container import get_consultation_service
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+settings = get_settings()
+
+# Resolved on first use: the container is only populated by the app lifespan
+_consultation_service = None
+
+# Serialized /consultations payload: (expires_at, data_version, body, gzipped body)
+_list_cache: Optional[Tuple[float, int, bytes, Optional[bytes]]] = None
+_list_cache_lock = asyncio.Lock()
+
+# Error payloads serialized once instead of going through the HTTPException handler
+_UNAVAILABLE_BODY = orjson.dumps({"detail": "Consultation service não disponível"})
+
+
+def _get_service():
+    """Return the memoized consultation service, resolving it once from the container"""
+    global _consultation_service
+    if _consultation_service is None:
+        _consultation_service = get_consultation_service()
+    return _consultation_service
+
+
+def _cached_list(data_version: int) -> Optional[Tuple[bytes, Optional[bytes]]]:
+    """Return the cached bodies if they are neither expired nor outdated by a write"""
+    cached = _list_cache
+    if cached is not None and cached[1] == data_version and time.monotonic() < cached[0]:
+        return cached[2], cached[3]
+    return None
+
+
+def _refresh_list_cache(consultation_service) -> Tuple[bytes, Optional[bytes]]:
+    """Query the latest consultations and store the serialized (and gzipped) payload"""
+    global _list_cache
+    data_version = consultation_service.data_version
+    consultations = consultation_service.list_consultations(limit=50)
+    logger.debug("Listando %d consultas persistidas", len(consultations))
+    body = orjson.dumps({
+        "consultations": consultations,
+        "total_consultations": len(consultations),
+        "timestamp": clock.utcnow()
+    })
+    # Compressed once here so GZipMiddleware does not redo it for every cache hit
+    gzipped = None
+    if len(body) >= settings.GZIP_MINIMUM_SIZE:
+        gzipped = gzip.compress(body, compresslevel=settings.GZIP_COMPRESS_LEVEL)
+    if settings.CONSULTATIONS_CACHE_TTL > 0:
+        _list_cache = (time.monotonic() + settings.CONSULTATIONS_CACHE_TTL, data_version, body, gzipped)
+    return body, gzipped
+
+
+def _ndjson_lines(consultation_service) -> Iterator[bytes]:
+    """Encode consultations one per line as rows arrive from the database"""
+    for consultation in consultation_service.iter_consultations(limit=50):
+        yield orjson.dumps(consultation) + b"\n"
+
+
 @router.get("/consultations")
-async def list_consultations():
-    """List all persisted consultations"""
-    logger.info("=== INÍCIO: Endpoint /consultations ===")
-    try:
-        consultation_service = get_consultation_service()
-        if consultation_service is None:
-            raise HTTPException(status_code=503, detail="Consultation service não disponível")
-        consultations = consultation_service.list_consultations(limit=50)
-        logger.info(f"Listando {len(consultations)} consultas persistidas")
-        logger.info("=== FIM: Endpoint /consultations - Sucesso ===")
-        return {
-            "consultations": consultations,
-            "total_consultations": len(consultations),
-            "timestamp": datetime.utcnow()
-        }
-    except HTTPException:
-        logger.error("=== FIM: Endpoint /consultations - HTTPException ===")
-        raise
-    except Exception as e:
-        logger.error(f"Erro ao listar consultas: {e}")
-        logger.error("=== FIM: Endpoint /consultations - Erro ===")
-        raise HTTPException(status_code=500, detail=f"Erro ao listar consultas: {str(e)}")
+async def list_consultations(
+    request: Request,
+    response_format: Literal["json", "ndjson"] = Query("json", alias="format")
+):
+    """List all persisted consultations (format=ndjson streams one consultation per line)"""
+    logger.debug("=== INÍCIO: Endpoint /consultations ===")
+    consultation_service = _get_service()
+    if consultation_service is None:
+        return Response(content=_UNAVAILABLE_BODY, media_type="application/json", status_code=503)
+    if response_format == "ndjson":
+        # Sync generator: Starlette iterates it in the threadpool, batch by batch
+        return StreamingResponse(_ndjson_lines(consultation_service), media_type="application/x-ndjson")
+    bodies = _cached_list(consultation_service.data_version)
+    if bodies is None:
+        # Only one request refreshes an expired entry; the rest reuse its result
+        async with _list_cache_lock:
+            bodies = _cached_list(consultation_service.data_version)
+            if bodies is None:
+                bodies = await run_in_threadpool(_refresh_list_cache, consultation_service)
+    body, gzipped = bodies
+    logger.debug("=== FIM: Endpoint /consultations - Sucesso ===")
+    if gzipped is not None and "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            content=gzipped,
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+        )
+    return Response(content=body, media_type="application/json")
 
 @router.get("/consultations/{consultation_id}")
 async def get_consultation(consultation_id: int):
     """Get a specific consultation by ID"""
-    logger.info(f"=== INÍCIO: Endpoint /consultations/{{consultation_id}} ===")
-    try:
-        consultation_service = get_consultation_service()
-        if consultation_service is None:
-            raise HTTPException(status_code=503, detail="Consultation service não disponível")
-        consultation = consultation_service.get_consultation(consultation_id)
-        if consultation is None:
-            raise HTTPException(status_code=404, detail=f"Consulta com ID {consultation_id} não encontrada")
-        logger.info(f"Consulta {consultation_id} recuperada com sucesso")
-        logger.info("=== FIM: Endpoint /consultations/{consultation_id} - Sucesso ===")
-        return consultation
-    except HTTPException:
-        logger.error("=== FIM: Endpoint /consultations/{consultation_id} - HTTPException ===")
-        raise
-    except Exception as e:
-        logger.error(f"Erro ao recuperar consulta {consultation_id}: {e}")
-        logger.error("=== FIM: Endpoint /consultations/{consultation_id} - Erro ===")
-        raise HTTPException(status_code=500, detail=f"Erro ao recuperar consulta: {str(e)}") 
\ No newline at end of file
+    logger.debug("=== INÍCIO: Endpoint /consultations/{consultation_id} ===")
+    consultation_service = _get_service()
+    if consultation_service is None:
+        return Response(content=_UNAVAILABLE_BODY, media_type="application/json", status_code=503)
+    consultation = await run_in_threadpool(consultation_service.get_consultation, consultation_id)
+    if consultation is None:
+        return Response(
+            content=orjson.dumps({"detail": f"Consulta com ID {consultation_id} não encontrada"}),
+            media_type="application/json",
+            status_code=404
+        )
+    logger.debug("Consulta %s recuperada com sucesso", consultation_id)
+    logger.debug("=== FIM: Endpoint /consultations/{consultation_id} - Sucesso ===")
+    # Encoded right after the threadpool call so the loop does not also walk it in jsonable_encoder
+    return Response(content=orjson.dumps(consultation), media_type="application/json")
\ No newline at end of file
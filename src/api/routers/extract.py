@@ -1,76 +1,77 @@
-from fastapi import APIRouter, Request, HTTPException
+from fastapi import APIRouter, Depends, Response
+from src.api.request_body import json_body, json_body_openapi
+from src.api.responses import model_response
 from src.api.schemas.chat import EntityExtractionRequest, EntityExtractionResponse
-from datetime import datetime
-import json
+from datetime import date
 import logging
+import orjson
+from src.core import clock
+from src.core.cache import ResponseCache
+from src.core.config import get_settings
 from src.core.container import get_entity_extractor
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-@router.post("/extract/entities", response_model=EntityExtractionResponse)
-async def extract_entities(request: Request) -> EntityExtractionResponse:
+settings = get_settings()
+
+# Extraction is a pure function of (model, day, message): relative dates such as
+# "amanhã" resolve against the current day, so the day is part of the key.
+extraction_cache = ResponseCache(
+    max_size=settings.RESPONSE_CACHE_MAX_SIZE,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL
+)
+
+@router.post(
+    "/extract/entities",
+    response_model=EntityExtractionResponse,
+    openapi_extra=json_body_openapi(EntityExtractionRequest)
+)
+async def extract_entities(
+    extraction_request: EntityExtractionRequest = Depends(json_body(EntityExtractionRequest))
+) -> Response:
     """Entity extraction endpoint with detailed logging and validation"""
-    logger.info("=== INÍCIO: Endpoint /extract/entities ===")
-    try:
-        logger.info(f"Content-Type: {request.headers.get('content-type', 'N/A')}")
-        logger.info(f"Content-Length: {request.headers.get('content-length', 'N/A')}")
-        body_bytes = await request.body()
-        logger.info(f"Raw body length: {len(body_bytes)} bytes")
-        try:
-            body_text = body_bytes.decode('utf-8')
-            logger.info(f"Body decoded as UTF-8: {body_text[:200]}...")
-        except UnicodeDecodeError as e:
-            logger.error(f"Erro de encoding UTF-8: {e}")
-            raise HTTPException(status_code=400, detail="Invalid UTF-8 encoding in request body")
-        try:
-            body_json = json.loads(body_text)
-            logger.info(f"JSON parsed successfully: {json.dumps(body_json, ensure_ascii=False)[:200]}...")
-        except json.JSONDecodeError as e:
-            logger.error(f"Erro ao fazer parse do JSON: {e}")
-            raise HTTPException(status_code=400, detail="Invalid JSON format")
-        try:
-            extraction_request = EntityExtractionRequest(**body_json)
-            logger.info(f"EntityExtractionRequest validado com sucesso: message='{extraction_request.message[:50]}...'")
-        except Exception as e:
-            logger.error(f"Erro na validação Pydantic: {e}")
-            raise HTTPException(status_code=422, detail=f"Validation error: {str(e)}")
-        entity_extractor = get_entity_extractor()
-        if entity_extractor is None:
-            logger.warning("Entity Extractor não disponível")
-            return EntityExtractionResponse(
-                success=False,
-                error="Serviço de extração não está disponível no momento"
-            )
-        result = await entity_extractor.extract_consulta_entities(extraction_request.message)
-        logger.info("Extração de entidades realizada com sucesso")
-        logger.info(f"Result completo: {json.dumps(result, ensure_ascii=False, indent=2)}")
-        if isinstance(result, dict) and result.get("success", False):
-            response = EntityExtractionResponse(
-                success=True,
-                entities=result.get("extracted_data"),
-                confidence_score=result.get("confidence_score"),
-                missing_fields=result.get("missing_fields"),
-                suggested_questions=result.get("suggested_questions"),
-                is_complete=result.get("is_complete"),
-                timestamp=datetime.utcnow()
-            )
-            logger.info(f"Response mapeada: success={response.success}, entities_keys={list(response.entities.keys()) if response.entities else None}, confidence={response.confidence_score}")
-        else:
-            response = EntityExtractionResponse(
-                success=False,
-                error=result.get("error", "Erro desconhecido na extração") if isinstance(result, dict) else str(result)
+    logger.debug("=== INÍCIO: Endpoint /extract/entities ===")
+    logger.debug("EntityExtractionRequest recebido: message='%.50s...'", extraction_request.message)
+    entity_extractor = get_entity_extractor()
+    if entity_extractor is None:
+        logger.warning("Entity Extractor não disponível")
+        return model_response(EntityExtractionResponse(
+            success=False,
+            error="Serviço de extração não está disponível no momento"
+        ))
+    cache_key = ResponseCache.make_key(settings.OPENAI_MODEL, date.today().isoformat(), extraction_request.message)
+    result = await extraction_cache.get_or_compute(
+        cache_key,
+        lambda: entity_extractor.extract_consulta_entities(extraction_request.message),
+        should_store=lambda r: isinstance(r, dict) and r.get("success", False)
+    )
+    logger.debug("Extração de entidades realizada com sucesso")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Result completo: %s", orjson.dumps(result, default=str).decode())
+    if isinstance(result, dict) and result.get("success", False):
+        # Fields come from the extractor's own result dict; skip re-validating them
+        response = EntityExtractionResponse.model_construct(
+            success=True,
+            entities=result.get("extracted_data"),
+            confidence_score=result.get("confidence_score"),
+            missing_fields=result.get("missing_fields"),
+            suggested_questions=result.get("suggested_questions"),
+            is_complete=result.get("is_complete"),
+            timestamp=clock.utcnow()
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Response mapeada: success=%s, entities_keys=%s, confidence=%s",
+                response.success,
+                list(response.entities.keys()) if response.entities else None,
+                response.confidence_score
             )
-            logger.info(f"Response de erro: {response.error}")
-        logger.info("=== FIM: Endpoint /extract/entities - Sucesso ===")
-        return response
-    except HTTPException:
-        logger.error("=== FIM: Endpoint /extract/entities - HTTPException ===")
-        raise
-    except Exception as e:
-        logger.error(f"Erro inesperado ao extrair entidades: {e}")
-        logger.error("=== FIM: Endpoint /extract/entities - Erro ===")
-        return EntityExtractionResponse(
+    else:
+        response = EntityExtractionResponse(
             success=False,
-            error=f"Erro ao processar extração: {str(e)}"
-        ) 
\ No newline at end of file
+            error=result.get("error", "Erro desconhecido na extração") if isinstance(result, dict) else str(result)
+        )
+        logger.info("Response de erro: %s", response.error)
+    logger.debug("=== FIM: Endpoint /extract/entities - Sucesso ===")
+    return model_response(response)
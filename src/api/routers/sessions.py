@@ -1,88 +1,106 @@
-from fastapi import APIRouter, HTTPException
-from src.core.reasoning.reasoning_coordinator import ReasoningCoordinator
-from src.core.container import get_session_service
+from fastapi import APIRouter, Query, Response
+from src.core.container import get_session_service, get_reasoning_coordinator
 from datetime import datetime
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Static payloads serialized once instead of per request
+_NOT_FOUND_BODY = orjson.dumps({"detail": "Session not found"})
+_DELETED_BODY = orjson.dumps({"message": "Session deleted successfully"})
+
 @router.get("/sessions/{session_id}")
-async def get_session_info(session_id: str):
-    """Get session information and context"""
-    logger.info(f"=== INÍCIO: Endpoint /sessions/{{session_id}} ===")
-    try:
-        session_service = get_session_service()
-        context = session_service.get_session(session_id)
-        if not context:
-            raise HTTPException(status_code=404, detail="Session not found")
-        reasoning_engine = ReasoningCoordinator()
-        if reasoning_engine:
-            summary = reasoning_engine.get_context_summary(context)
-        else:
-            summary = {
-                "total_messages": len(context.get("conversation_history", [])),
-                "extracted_fields": list(context.get("extracted_data", {}).keys()),
-                "data_completeness": 0.0,
-                "last_action": "unknown"
-            }
-        response = {
-            "session_id": session_id,
-            "session_start": context.get("session_start"),
-            "total_messages": summary["total_messages"],
-            "extracted_fields": summary["extracted_fields"],
-            "data_completeness": summary["data_completeness"],
-            "last_action": summary["last_action"],
-            "average_confidence": context.get("average_confidence", 0.0),
-            "conversation_history": context.get("conversation_history", [])
+async def get_session_info(session_id: str, include_history: bool = Query(False)):
+    """Get session information (the conversation history only if include_history=true)"""
+    logger.debug("=== INÍCIO: Endpoint /sessions/{session_id} ===")
+    session_service = get_session_service()
+    context = session_service.get_session(session_id)
+    if not context:
+        return Response(content=_NOT_FOUND_BODY, media_type="application/json", status_code=404)
+    # Shared coordinator from the container; building one per call set up all its components
+    reasoning_engine = get_reasoning_coordinator()
+    if reasoning_engine:
+        summary = reasoning_engine.get_context_summary(context)
+    else:
+        summary = {
+            "total_messages": len(context.get("conversation_history", [])),
+            "extracted_fields": list(context.get("extracted_data", {}).keys()),
+            "data_completeness": 0.0,
+            "last_action": "unknown"
         }
-        logger.info(f"=== FIM: Endpoint /sessions/{{session_id}} - Sucesso ===")
-        return response
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Erro ao obter informações da sessão: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    response = {
+        "session_id": session_id,
+        "session_start": context.get("session_start"),
+        "total_messages": summary["total_messages"],
+        "extracted_fields": summary["extracted_fields"],
+        "data_completeness": summary["data_completeness"],
+        "last_action": summary["last_action"],
+        "average_confidence": context.get("average_confidence", 0.0)
+    }
+    if include_history:
+        # Full history is the bulk of the payload; /history serves it a page at a time
+        response["conversation_history"] = context.get("conversation_history", [])
+    logger.debug("=== FIM: Endpoint /sessions/{session_id} - Sucesso ===")
+    # Serialized straight to bytes; returning the dict would walk it through jsonable_encoder first
+    return Response(content=orjson.dumps(response), media_type="application/json")
+
+@router.get("/sessions/{session_id}/history")
+async def get_session_history(
+    session_id: str,
+    limit: int = Query(50, ge=1, le=1000),
+    offset: int = Query(0, ge=0)
+):
+    """Get one page of a session's conversation history, oldest first"""
+    logger.debug("=== INÍCIO: Endpoint /sessions/{session_id}/history ===")
+    context = get_session_service().get_session(session_id)
+    if not context:
+        return Response(content=_NOT_FOUND_BODY, media_type="application/json", status_code=404)
+    history = context.get("conversation_history", [])
+    logger.debug("=== FIM: Endpoint /sessions/{session_id}/history - Sucesso ===")
+    return Response(
+        content=orjson.dumps({
+            "session_id": session_id,
+            "conversation_history": history[offset:offset + limit],
+            "total": len(history),
+            "limit": limit,
+            "offset": offset
+        }),
+        media_type="application/json"
+    )
 
 @router.delete("/sessions/{session_id}")
 async def delete_session(session_id: str):
     """Delete a session"""
-    logger.info(f"=== INÍCIO: Endpoint DELETE /sessions/{{session_id}} ===")
-    try:
-        session_service = get_session_service()
-        context = session_service.get_session(session_id)
-        if not context:
-            raise HTTPException(status_code=404, detail="Session not found")
-        session_service.delete_session(session_id)
-        logger.info(f"Sessão removida: {session_id}")
-        logger.info(f"=== FIM: Endpoint DELETE /sessions/{{session_id}} - Sucesso ===")
-        return {"message": "Session deleted successfully"}
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Erro ao deletar sessão: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    logger.debug("=== INÍCIO: Endpoint DELETE /sessions/{session_id} ===")
+    session_service = get_session_service()
+    context = session_service.get_session(session_id)
+    if not context:
+        return Response(content=_NOT_FOUND_BODY, media_type="application/json", status_code=404)
+    session_service.delete_session(session_id)
+    logger.debug("Sessão removida: %s", session_id)
+    logger.debug("=== FIM: Endpoint DELETE /sessions/{session_id} - Sucesso ===")
+    return Response(content=_DELETED_BODY, media_type="application/json")
 
 @router.get("/sessions")
-async def list_sessions():
-    """List all active sessions"""
-    logger.info("=== INÍCIO: Endpoint /sessions ===")
-    try:
-        session_service = get_session_service()
-        sessions_dict = session_service.list_sessions()
-        session_list = []
-        for session_id, context in sessions_dict.items():
-            session_info = {
-                "session_id": session_id,
-                "session_start": context.get("session_start"),
-                "total_messages": len(context.get("conversation_history", [])),
-                "extracted_fields": list(context.get("extracted_data", {}).keys()),
-                "average_confidence": context.get("average_confidence", 0.0)
-            }
-            session_list.append(session_info)
-        logger.info(f"=== FIM: Endpoint /sessions - {len(session_list)} sessões ===")
-        return {"sessions": session_list, "total": len(session_list)}
-    except Exception as e:
-        logger.error(f"Erro ao listar sessões: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}") 
\ No newline at end of file
+async def list_sessions(
+    limit: int = Query(50, ge=1, le=1000),
+    offset: int = Query(0, ge=0)
+):
+    """List active sessions, one page at a time"""
+    logger.debug("=== INÍCIO: Endpoint /sessions ===")
+    session_service = get_session_service()
+    # Summaries are maintained on every session write; orjson serializes the slots dataclasses directly
+    session_list, total = session_service.page_summaries(offset=offset, limit=limit)
+    logger.debug("=== FIM: Endpoint /sessions - %d sessões ===", len(session_list))
+    return Response(
+        content=orjson.dumps({
+            "sessions": session_list,
+            "total": total,
+            "limit": limit,
+            "offset": offset
+        }),
+        media_type="application/json"
+    )
@@ -1,98 +1,85 @@
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Depends, Response
+from src.api.request_body import json_body, json_body_openapi
+from src.api.responses import model_response
 from src.api.schemas.chat import ValidationRequest, ValidationResponse
+from src.core.cache import ResponseCache
+from src.core.config import get_settings
 from src.core.validation.normalizers.data_normalizer import DataNormalizer
-import json
+from datetime import date
 import logging
+import orjson
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 data_normalizer = DataNormalizer()
 
-@router.post("/validate", response_model=ValidationResponse)
-async def validate_data(request: Request) -> ValidationResponse:
+# Domain -> normalizer, resolved with one dict lookup; new domains register here.
+# Unregistered domains are still checked with the consultation rules but get no data back.
+_NORMALIZERS = {
+    "consulta": data_normalizer.normalize_consultation_data,
+}
+_DEFAULT_NORMALIZER = data_normalizer.normalize_consultation_data
+
+settings = get_settings()
+
+# Normalization depends only on (day, payload): relative dates resolve against
+# the current day. Clients retry and poll with identical payloads.
+normalization_cache = ResponseCache(
+    max_size=settings.RESPONSE_CACHE_MAX_SIZE,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL
+)
+
+@router.post("/validate", response_model=ValidationResponse, openapi_extra=json_body_openapi(ValidationRequest))
+async def validate_data(
+    validation_request: ValidationRequest = Depends(json_body(ValidationRequest))
+) -> Response:
     """Validation endpoint with detailed logging and error handling"""
-    logger.info("=== INÍCIO: Endpoint /validate ===")
-    try:
-        logger.info(f"Content-Type: {request.headers.get('content-type', 'N/A')}")
-        logger.info(f"Content-Length: {request.headers.get('content-length', 'N/A')}")
-        body_bytes = await request.body()
-        logger.info(f"Raw body length: {len(body_bytes)} bytes")
-        try:
-            body_text = body_bytes.decode('utf-8')
-            logger.info(f"Body decoded as UTF-8: {body_text[:200]}...")
-        except UnicodeDecodeError as e:
-            logger.error(f"Erro de encoding UTF-8: {e}")
-            return ValidationResponse(
-                success=False,
-                normalized_data={},
-                validation_errors=[f"Invalid UTF-8 encoding in request body: {str(e)}"],
-                confidence_score=0.0
-            )
-        try:
-            body_json = json.loads(body_text)
-            logger.info(f"JSON parsed successfully: {json.dumps(body_json, ensure_ascii=False)[:200]}...")
-        except json.JSONDecodeError as e:
-            logger.error(f"Erro ao fazer parse do JSON: {e}")
-            return ValidationResponse(
-                success=False,
-                normalized_data={},
-                validation_errors=[f"Invalid JSON format: {str(e)}"],
-                confidence_score=0.0
-            )
-        try:
-            validation_request = ValidationRequest(**body_json)
-            logger.info(f"ValidationRequest validado com sucesso: domain='{validation_request.domain}', data_keys={list(validation_request.data.keys()) if validation_request.data else None}")
-        except Exception as e:
-            logger.error(f"Erro na validação Pydantic: {e}")
-            return ValidationResponse(
-                success=False,
-                normalized_data={},
-                validation_errors=[f"Validation error: {str(e)}"],
-                confidence_score=0.0
-            )
-        try:
-            logger.info(f"Usando DataNormalizer unificado para domínio '{validation_request.domain}'")
-            normalization_result = data_normalizer.normalize_consultation_data(validation_request.data)
-            validation_errors = []
-            for field_result in normalization_result.validation_summary.field_results.values():
-                if field_result.errors:
-                    validation_errors.extend(field_result.errors)
-            result = {
-                "normalized_data": normalization_result.normalized_data,
-                "validation_errors": validation_errors,
-                "confidence_score": normalization_result.confidence_score,
-                "field_mapping_info": normalization_result.field_mapping_info,
-                "success": normalization_result.success
-            }
-            logger.info("Validação realizada com sucesso")
-            logger.info(f"Result completo: {json.dumps(result, ensure_ascii=False, indent=2)}")
-            normalized_data = result.get("normalized_data", {}) if validation_request.domain == "consulta" else result.get("normalized_entities", {})
-            validation_errors = result.get("validation_errors", [])
-            confidence_score = result.get("confidence_score", 0.0)
-            success = confidence_score > 0.0 and len(validation_errors) == 0
-            response = ValidationResponse(
-                success=success,
-                normalized_data=normalized_data,
-                validation_errors=validation_errors,
-                confidence_score=confidence_score
-            )
-            logger.info(f"Response criada: success={response.success}, confidence={response.confidence_score}, errors_count={len(response.validation_errors)}")
-        except Exception as e:
-            logger.error(f"Erro durante a normalização: {e}")
-            return ValidationResponse(
-                success=False,
-                normalized_data={},
-                validation_errors=[f"Erro durante a normalização: {str(e)}"],
-                confidence_score=0.0
-            )
-        logger.info("=== FIM: Endpoint /validate - Sucesso ===")
-        return response
-    except Exception as e:
-        logger.error(f"Erro inesperado ao processar validação: {e}")
-        logger.error("=== FIM: Endpoint /validate - Erro ===")
-        return ValidationResponse(
-            success=False,
-            normalized_data={},
-            validation_errors=[f"Erro inesperado: {str(e)}"],
-            confidence_score=0.0
-        ) 
\ No newline at end of file
+    logger.debug("=== INÍCIO: Endpoint /validate ===")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "ValidationRequest recebido: domain='%s', data_keys=%s",
+            validation_request.domain,
+            list(validation_request.data.keys()) if validation_request.data else None
+        )
+    logger.debug("Usando DataNormalizer unificado para domínio '%s'", validation_request.domain)
+    normalize = _NORMALIZERS.get(validation_request.domain, _DEFAULT_NORMALIZER)
+    cache_key = ResponseCache.make_key(
+        date.today().isoformat(),
+        validation_request.domain,
+        orjson.dumps(validation_request.data, option=orjson.OPT_SORT_KEYS, default=str).decode()
+    )
+    normalization_result = normalization_cache.get(cache_key)
+    if normalization_result is None:
+        normalization_result = normalize(validation_request.data)
+        normalization_cache.set(cache_key, normalization_result)
+    
+    validation_errors = []
+    for field_result in normalization_result.validation_summary.field_results.values():
+        if field_result.errors:
+            validation_errors.extend(field_result.errors)
+    confidence_score = normalization_result.confidence_score
+    logger.debug("Validação realizada com sucesso")
+    if logger.isEnabledFor(logging.DEBUG):
+        result = {
+            "normalized_data": normalization_result.normalized_data,
+            "validation_errors": validation_errors,
+            "confidence_score": confidence_score,
+            "field_mapping_info": normalization_result.field_mapping_info,
+            "success": normalization_result.success
+        }
+        logger.debug("Result completo: %s", orjson.dumps(result, default=str).decode())
+    
+    normalized_data = normalization_result.normalized_data if validation_request.domain in _NORMALIZERS else {}
+    # Built from the normalizer's typed result; skip re-validating every field
+    response = ValidationResponse.model_construct(
+        success=confidence_score > 0.0 and len(validation_errors) == 0,
+        normalized_data=normalized_data,
+        validation_errors=validation_errors,
+        confidence_score=confidence_score
+    )
+    logger.debug(
+        "Response criada: success=%s, confidence=%s, errors_count=%d",
+        response.success, response.confidence_score, len(response.validation_errors)
+    )
+    logger.debug("=== FIM: Endpoint /validate - Sucesso ===")
+    return model_response(response)
@@ -2,6 +2,8 @@ from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 
+from src.core import clock
+
 
 class ChatRequest(BaseModel):
     """Schema para requisições de chat"""
@@ -18,7 +20,7 @@ class ChatRequest(BaseModel):
 class ChatResponse(BaseModel):
     """Schema para respostas de chat com dados do ReasoningEngine e persistência"""
     response: str = Field(..., description="Resposta do sistema")
-    timestamp: datetime = Field(default_factory=datetime.now, description="Timestamp da resposta")
+    timestamp: datetime = Field(default_factory=clock.utcnow, description="Timestamp da resposta")
     session_id: str = Field(..., description="ID da sessão do chat")
     action: Optional[str] = Field(None, description="Ação executada pelo ReasoningEngine")
     extracted_data: Optional[Dict[str, Any]] = Field(None, description="Dados extraídos pela engine")
@@ -48,7 +50,7 @@ class EntityExtractionResponse(BaseModel):
     suggested_questions: Optional[list] = Field(None, description="Perguntas sugeridas para campos faltantes")
     is_complete: Optional[bool] = Field(None, description="Indica se todos os campos foram preenchidos")
     error: Optional[str] = Field(None, description="Mensagem de erro, se houver")
-    timestamp: datetime = Field(default_factory=datetime.now, description="Timestamp da extração")
+    timestamp: datetime = Field(default_factory=clock.utcnow, description="Timestamp da extração")
 
 
 class ValidationRequest(BaseModel):
@@ -63,4 +65,4 @@ class ValidationResponse(BaseModel):
     normalized_data: Dict[str, Any] = Field(..., description="Dados normalizados")
     validation_errors: List[str] = Field(default_factory=list, description="Lista de erros de validação")
     confidence_score: float = Field(..., description="Score de confiança da validação (0.0-1.0)")
-    timestamp: datetime = Field(default_factory=datetime.now, description="Timestamp da validação") 
\ No newline at end of file
+    timestamp: datetime = Field(default_factory=clock.utcnow, description="Timestamp da validação") 
\ No newline at end of file
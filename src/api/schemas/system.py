@@ -2,9 +2,11 @@ from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Dict, Literal
 
+from src.core import clock
+
 
 class HealthResponse(BaseModel):
     """Schema para resposta de health check"""
     status: Literal["healthy", "unhealthy"] = Field(..., description="Status geral do sistema")
     services: Dict[str, Literal["healthy", "unhealthy"]] = Field(..., description="Status de cada serviço")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Timestamp da verificação") 
\ No newline at end of file
+    timestamp: datetime = Field(default_factory=clock.utcnow, description="Timestamp da verificação") 
\ No newline at end of file
@@ -0,0 +1,11 @@
+"""
+Módulo de cache para respostas de LLM.
+
+Evita chamadas repetidas à OpenAI quando a mesma entrada já foi processada.
+"""
+
+from .response_cache import ResponseCache
+
+__all__ = [
+    'ResponseCache'
+]
@@ -0,0 +1,148 @@
+"""
+Exact-match TTL cache for LLM responses.
+
+Keys are blake2b digests of every input that influences the model output
+(model, prompts, message), so a hit is only served for an identical request.
+Concurrent misses on the same key are coalesced into a single computation.
+"""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from src.core.logging.logger_factory import get_logger
+
+logger = get_logger(__name__)
+
+_MISSING = object()
+
+
+def _consume_exception(task: asyncio.Task) -> None:
+    """Mark the task's exception as retrieved when every waiter has gone away."""
+    if not task.cancelled():
+        task.exception()
+
+
+class ResponseCache:
+    """
+    In-process LRU cache with per-entry TTL.
+    
+    Cached values are shared between callers and must be treated as read-only.
+    """
+    
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 300.0):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_size: Maximum number of entries kept (least recently used are evicted)
+            ttl_seconds: Lifetime of each entry in seconds
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+    
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """
+        Build a cache key from the request inputs.
+        
+        Args:
+            *parts: Strings that determine the response (model, prompt, message...)
+            
+        Returns:
+            str: 32-char hex digest
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            digest.update(str(part).encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: str, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    async def get_or_compute(
+        self,
+        key: str,
+        compute_fn: Callable[[], Awaitable[Any]],
+        should_store: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """
+        Return the cached value for key or compute, store and return it.
+        
+        Args:
+            key: Cache key (see make_key)
+            compute_fn: Coroutine factory producing the value on a miss
+            should_store: Optional predicate; results failing it are not cached
+            
+        Returns:
+            Cached or freshly computed value. Exceptions from compute_fn propagate
+            (to every coalesced caller) and are never cached. Cancelling one
+            caller does not cancel the computation the others are waiting on.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            self.hits += 1
+            logger.debug(f"Cache hit: {key}")
+            return value
+        
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            # Same request already running: wait for its result instead of
+            # issuing a duplicate upstream call
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            # The computation runs in its own task, so a cancelled caller (client
+            # disconnect, request timeout) does not abort it for the others
+            inflight = asyncio.ensure_future(self._compute(key, compute_fn, should_store))
+            inflight.add_done_callback(_consume_exception)
+            self._inflight[key] = inflight
+        return await asyncio.shield(inflight)
+    
+    async def _compute(
+        self,
+        key: str,
+        compute_fn: Callable[[], Awaitable[Any]],
+        should_store: Optional[Callable[[Any], bool]]
+    ) -> Any:
+        """Run compute_fn once for key and store the result (body of the in-flight task)."""
+        try:
+            value = await compute_fn()
+            if should_store is None or should_store(value):
+                self.set(key, value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,96 @@
+"""
+Second-resolution wall clock shared across requests.
+
+A background task refreshes the cached UTC datetime (and its ISO string)
+once per second while the app is running, so request handlers read a
+module global instead of building new datetime objects. Outside the
+app lifespan (CLI, tests) the helpers fall back to the real clock.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Optional
+
+from src.core.logging.logger_factory import get_logger
+
+logger = get_logger(__name__)
+
+# Refresh interval of the cached clock in seconds
+TICK_INTERVAL = 1.0
+
+_now: datetime = datetime.utcnow()
+_now_iso: str = _now.isoformat()
+_ticker: Optional[asyncio.Task] = None
+
+
+def _refresh() -> None:
+    global _now, _now_iso
+    _now = datetime.utcnow()
+    _now_iso = _now.isoformat()
+
+
+async def _tick() -> None:
+    while True:
+        _refresh()
+        await asyncio.sleep(TICK_INTERVAL)
+
+
+def utcnow() -> datetime:
+    """
+    Return the current UTC time at second resolution.
+    
+    Returns:
+        datetime: Cached naive UTC datetime (fresh value if the ticker is not running)
+    """
+    if _ticker is None:
+        return datetime.utcnow()
+    return _now
+
+
+def utcnow_iso() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string at second resolution.
+    
+    Returns:
+        str: Cached ISO string (fresh value if the ticker is not running)
+    """
+    if _ticker is None:
+        return datetime.utcnow().isoformat()
+    return _now_iso
+
+
+def isoformat(value: datetime) -> str:
+    """
+    Format a datetime as ISO 8601, reusing the cached string for the current tick.
+    
+    Args:
+        value: Datetime to format (typically obtained from utcnow())
+        
+    Returns:
+        str: ISO string, without reformatting when value is the cached tick
+    """
+    if value is _now:
+        return _now_iso
+    return value.isoformat()
+
+
+def start_clock() -> None:
+    """Start the background ticker on the running event loop."""
+    global _ticker
+    if _ticker is None:
+        _refresh()
+        _ticker = asyncio.get_running_loop().create_task(_tick())
+        logger.info("Clock ticker iniciado")
+
+
+async def stop_clock() -> None:
+    """Cancel the background ticker (used on application shutdown)."""
+    global _ticker
+    if _ticker is not None:
+        _ticker.cancel()
+        try:
+            await _ticker
+        except asyncio.CancelledError:
+            pass
+        _ticker = None
+        logger.info("Clock ticker encerrado")
@@ -6,7 +6,7 @@ with validation and clear error messages.
 """
 
 import os
-from typing import Optional, List
+from typing import Optional, Tuple
 
 
 class Settings:
@@ -32,18 +32,33 @@ class Settings:
         self.APP_NAME = "Data Structuring Agent"
         self.APP_VERSION = "1.0.0"
         self.DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+        self.ENVIRONMENT = os.getenv("ENVIRONMENT", "development").lower()
         
         # Server Configuration
         self.HOST = os.getenv("HOST", "0.0.0.0")
         self.PORT = int(os.getenv("PORT", "8000"))
+        self.WORKERS = int(os.getenv("WORKERS", str(os.cpu_count() or 1)))
         
         # Extended API Configuration
         self.OPENAI_API_URL = os.getenv("OPENAI_API_URL", "https://api.openai.com/v1/chat/completions")
         self.OPENAI_TIMEOUT = int(os.getenv("OPENAI_TIMEOUT", "30"))
+        self.MAX_CONCURRENT_OPENAI = int(os.getenv("MAX_CONCURRENT_OPENAI", "50"))
+        # End-to-end budget for one chat message (may span several OpenAI calls)
+        self.CHAT_REQUEST_TIMEOUT = float(os.getenv("CHAT_REQUEST_TIMEOUT", "60"))
+        # Reply before the consultation insert finishes (status via /chat/persist-status)
+        self.CHAT_ASYNC_PERSISTENCE = os.getenv("CHAT_ASYNC_PERSISTENCE", "false").lower() == "true"
         
         # Database Timeouts
         self.DB_CONNECTION_TIMEOUT = float(os.getenv("DB_CONNECTION_TIMEOUT", "5.0"))
         
+        # Database Connection Pool
+        self.DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+        self.DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+        self.DB_POOL_PREWARM = int(os.getenv("DB_POOL_PREWARM", "5"))
+        
+        # Worker threads for blocking calls (sync DB access)
+        self.THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "100"))
+        
         # API Request Timeouts
         self.API_REQUEST_TIMEOUT = int(os.getenv("API_REQUEST_TIMEOUT", "10"))
         self.MAX_API_RETRIES = int(os.getenv("MAX_API_RETRIES", "3"))
@@ -57,6 +72,25 @@ class Settings:
         self.NAME_MIN_LENGTH = int(os.getenv("NAME_MIN_LENGTH", "2"))
         self.NAME_MAX_LENGTH = int(os.getenv("NAME_MAX_LENGTH", "100"))
         
+        # LLM Response Cache
+        self.RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "300"))
+        self.RESPONSE_CACHE_MAX_SIZE = int(os.getenv("RESPONSE_CACHE_MAX_SIZE", "1024"))
+        
+        # Response Compression
+        self.GZIP_MINIMUM_SIZE = int(os.getenv("GZIP_MINIMUM_SIZE", "1024"))
+        self.GZIP_COMPRESS_LEVEL = int(os.getenv("GZIP_COMPRESS_LEVEL", "1"))
+        
+        # Consultations list cache (0 disables)
+        self.CONSULTATIONS_CACHE_TTL = float(os.getenv("CONSULTATIONS_CACHE_TTL", "5"))
+        
+        # /system/health result cache (0 disables)
+        self.HEALTH_CACHE_TTL = float(os.getenv("HEALTH_CACHE_TTL", "1"))
+        
+        # Session Store
+        self.SESSION_TTL = float(os.getenv("SESSION_TTL", "86400"))
+        self.SESSION_CLEANUP_INTERVAL = float(os.getenv("SESSION_CLEANUP_INTERVAL", "60"))
+        self.SESSION_MAX_COUNT = int(os.getenv("SESSION_MAX_COUNT", "100000"))
+        
         # Application URLs
         self.BASE_URL = f"http://{self.HOST}:{self.PORT}"
         
@@ -84,25 +118,33 @@ class Settings:
         if self.LOG_LEVEL not in allowed_levels:
             raise ValueError(f"LOG_LEVEL must be one of: {', '.join(allowed_levels)}")
     
+    @property
+    def is_production(self) -> bool:
+        """Whether the app runs in production (interactive docs are disabled)."""
+        return self.ENVIRONMENT == "production"
+    
     def _validate_port(self):
         """Validate port is within valid range."""
         if not 1 <= self.PORT <= 65535:
             raise ValueError("PORT must be between 1 and 65535")
+        
+        if not 1 <= self.WORKERS <= 64:
+            raise ValueError("WORKERS must be between 1 and 64")
     
-    def _parse_cors_origins(self) -> List[str]:
-        """Parse CORS origins from environment variable or use defaults."""
+    def _parse_cors_origins(self) -> Tuple[str, ...]:
+        """Parse CORS origins from environment variable or use defaults (immutable)."""
         cors_env = os.getenv("ALLOWED_ORIGINS")
         if cors_env:
             # Parse comma-separated origins
-            return [origin.strip() for origin in cors_env.split(",")]
+            return tuple(origin.strip() for origin in cors_env.split(","))
         
         # Default origins for development
-        return [
+        return (
             "http://localhost:3000",
             "http://localhost:5678", 
             "http://localhost:8000",
             "http://localhost:3001",
-        ]
+        )
     
     def _validate_extended_settings(self):
         """Validate extended configuration settings."""
@@ -110,9 +152,27 @@ class Settings:
         if not 1 <= self.OPENAI_TIMEOUT <= 300:
             raise ValueError("OPENAI_TIMEOUT must be between 1 and 300 seconds")
         
+        if not 1 <= self.MAX_CONCURRENT_OPENAI <= 1000:
+            raise ValueError("MAX_CONCURRENT_OPENAI must be between 1 and 1000")
+        
+        if not 1 <= self.CHAT_REQUEST_TIMEOUT <= 600:
+            raise ValueError("CHAT_REQUEST_TIMEOUT must be between 1 and 600 seconds")
+        
         if not 0.1 <= self.DB_CONNECTION_TIMEOUT <= 60.0:
             raise ValueError("DB_CONNECTION_TIMEOUT must be between 0.1 and 60.0 seconds")
         
+        if not 1 <= self.DB_POOL_SIZE <= 200:
+            raise ValueError("DB_POOL_SIZE must be between 1 and 200")
+        
+        if not 0 <= self.DB_MAX_OVERFLOW <= 200:
+            raise ValueError("DB_MAX_OVERFLOW must be between 0 and 200")
+        
+        if not 0 <= self.DB_POOL_PREWARM <= self.DB_POOL_SIZE:
+            raise ValueError("DB_POOL_PREWARM must be between 0 and DB_POOL_SIZE")
+        
+        if not 1 <= self.THREADPOOL_SIZE <= 1000:
+            raise ValueError("THREADPOOL_SIZE must be between 1 and 1000")
+        
         if not 1 <= self.API_REQUEST_TIMEOUT <= 120:
             raise ValueError("API_REQUEST_TIMEOUT must be between 1 and 120 seconds")
         
@@ -132,6 +192,36 @@ class Settings:
         if not self.NAME_MAX_LENGTH <= 500:
             raise ValueError("NAME_MAX_LENGTH must be <= 500")
         
+        # Validate response cache
+        if not 0 <= self.RESPONSE_CACHE_TTL <= 86400:
+            raise ValueError("RESPONSE_CACHE_TTL must be between 0 and 86400 seconds")
+        
+        if not 1 <= self.RESPONSE_CACHE_MAX_SIZE <= 100000:
+            raise ValueError("RESPONSE_CACHE_MAX_SIZE must be between 1 and 100000")
+        
+        # Validate response compression
+        if not 0 <= self.GZIP_MINIMUM_SIZE <= 10485760:
+            raise ValueError("GZIP_MINIMUM_SIZE must be between 0 and 10485760 bytes")
+        
+        if not 1 <= self.GZIP_COMPRESS_LEVEL <= 9:
+            raise ValueError("GZIP_COMPRESS_LEVEL must be between 1 and 9")
+        
+        if not 0 <= self.CONSULTATIONS_CACHE_TTL <= 3600:
+            raise ValueError("CONSULTATIONS_CACHE_TTL must be between 0 and 3600 seconds")
+        
+        if not 0 <= self.HEALTH_CACHE_TTL <= 60:
+            raise ValueError("HEALTH_CACHE_TTL must be between 0 and 60 seconds")
+        
+        # Validate session store
+        if not 60 <= self.SESSION_TTL <= 604800:
+            raise ValueError("SESSION_TTL must be between 60 and 604800 seconds")
+        
+        if not 1 <= self.SESSION_CLEANUP_INTERVAL <= 3600:
+            raise ValueError("SESSION_CLEANUP_INTERVAL must be between 1 and 3600 seconds")
+        
+        if not 1 <= self.SESSION_MAX_COUNT <= 10000000:
+            raise ValueError("SESSION_MAX_COUNT must be between 1 and 10000000")
+        
         # Validate API URL
         if not self.OPENAI_API_URL.startswith(("http://", "https://")):
             raise ValueError("OPENAI_API_URL must start with 'http://' or 'https://'")
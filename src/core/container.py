@@ -8,7 +8,7 @@ dependency injection.
 
 from typing import Dict, Any, Optional, TypeVar, Type
 import threading
-from src.core.openai_client import OpenAIClient
+from src.core.openai_client import OpenAIClient, close_http_client
 from src.core.entity_extraction import EntityExtractor
 from src.core.reasoning.reasoning_coordinator import ReasoningCoordinator
 from src.services.consultation_service import ConsultationService
@@ -53,51 +53,61 @@ class ServiceContainer:
         3. ReasoningCoordinator (no external dependencies)
         4. ConsultationService (depends on EntityExtractor)
         """
-        if 'openai_client' not in self._services:
-            self._services['openai_client'] = OpenAIClient()
-        
-        if 'entity_extractor' not in self._services:
-            # Inject OpenAI client to avoid duplication
-            openai_client = self._services['openai_client']
-            self._services['entity_extractor'] = EntityExtractor(openai_client=openai_client)
-        
-        if 'reasoning_coordinator' not in self._services:
-            # ReasoningCoordinator doesn't need external dependencies
-            self._services['reasoning_coordinator'] = ReasoningCoordinator()
-        
-        if 'consultation_service' not in self._services:
-            # Inject shared EntityExtractor to avoid duplication
-            entity_extractor = self._services['entity_extractor']
-            self._services['consultation_service'] = ConsultationService(
-                entity_extractor=entity_extractor
-            )
-        
-        if 'chat_service' not in self._services:
-            from src.services.chat_service import ChatService
-            # Inject shared SessionService to avoid duplication  
-            session_service = self._services.get('session_service')
-            if session_service is None:
-                from src.services.session_service import SessionService
-                session_service = SessionService()
-                self._services['session_service'] = session_service
-            self._services['chat_service'] = ChatService(session_service=session_service)
-        
-        if 'extraction_service' not in self._services:
-            from src.services.extraction_service import ExtractionService
-            # Inject shared EntityExtractor to avoid duplication
-            entity_extractor = self._services['entity_extractor']
-            self._services['extraction_service'] = ExtractionService(
-                entity_extractor=entity_extractor
-            )
-        
-        if 'validation_service' not in self._services:
-            from src.services.validation_service import ValidationService
-            self._services['validation_service'] = ValidationService()
+        for service_name in self._FACTORIES:
+            self.get_service(service_name)
+    
+    def _create_openai_client(self) -> OpenAIClient:
+        return OpenAIClient()
+    
+    def _create_entity_extractor(self) -> EntityExtractor:
+        # Inject OpenAI client to avoid duplication
+        return EntityExtractor(openai_client=self.get_service('openai_client'))
+    
+    def _create_reasoning_coordinator(self) -> ReasoningCoordinator:
+        # ReasoningCoordinator doesn't need external dependencies
+        return ReasoningCoordinator()
+    
+    def _create_consultation_service(self) -> ConsultationService:
+        # Inject shared EntityExtractor to avoid duplication
+        return ConsultationService(entity_extractor=self.get_service('entity_extractor'))
+    
+    def _create_session_service(self):
+        from src.services.session_service import SessionService
+        return SessionService()
+    
+    def _create_chat_service(self):
+        from src.services.chat_service import ChatService
+        # Inject shared SessionService to avoid duplication
+        return ChatService(session_service=self.get_service('session_service'))
+    
+    def _create_extraction_service(self):
+        from src.services.extraction_service import ExtractionService
+        # Inject shared EntityExtractor to avoid duplication
+        return ExtractionService(entity_extractor=self.get_service('entity_extractor'))
+    
+    def _create_validation_service(self):
+        from src.services.validation_service import ValidationService
+        return ValidationService()
+    
+    # Factory per service, in dependency order; each builds only what it needs
+    _FACTORIES = {
+        'openai_client': _create_openai_client,
+        'entity_extractor': _create_entity_extractor,
+        'reasoning_coordinator': _create_reasoning_coordinator,
+        'consultation_service': _create_consultation_service,
+        'session_service': _create_session_service,
+        'chat_service': _create_chat_service,
+        'extraction_service': _create_extraction_service,
+        'validation_service': _create_validation_service,
+    }
     
     def get_service(self, service_name: str) -> Any:
         """
         Get a service instance by name.
         
+        Only the requested service and its dependencies are built on first
+        access, so a worker that never serves chat never creates its clients.
+        
         Args:
             service_name: Name of the service to retrieve
             
@@ -107,14 +117,18 @@ class ServiceContainer:
         Raises:
             KeyError: If service is not registered
         """
-        if service_name not in self._services:
-            # Lazy initialization
-            self.initialize_services()
+        try:
+            return self._services[service_name]
+        except KeyError:
+            pass
         
-        if service_name not in self._services:
+        factory = self._FACTORIES.get(service_name)
+        if factory is None:
             raise KeyError(f"Service '{service_name}' not found in container")
         
-        return self._services[service_name]
+        # Lazy initialization
+        service = self._services[service_name] = factory(self)
+        return service
     
     def register_service(self, service_name: str, service_instance: Any) -> None:
         """
@@ -128,6 +142,18 @@ class ServiceContainer:
         """
         self._services[service_name] = service_instance
     
+    async def aclose(self) -> None:
+        """
+        Release resources held by the services (application shutdown).
+        
+        Flushes queued consultation inserts before closing the shared
+        HTTP client, so no in-flight write loses its connection.
+        """
+        consultation_service = self._services.get('consultation_service')
+        if consultation_service is not None:
+            await consultation_service.writer.close()
+        await close_http_client()
+    
     def clear_services(self) -> None:
         """
         Clear all registered services.
@@ -41,7 +41,12 @@ def get_engine() -> object:
     if _engine is None:
         settings = get_settings()
         logger.info(f"Creating database engine for: {settings.DATABASE_URL}")
-        _engine = create_engine(settings.DATABASE_URL)
+        _engine = create_engine(
+            settings.DATABASE_URL,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_pre_ping=True
+        )
         engine = _engine
     return _engine
 
@@ -136,6 +141,33 @@ def create_tables() -> bool:
         raise SQLAlchemyError(error_msg) from e
 
 
+def warm_up_pool(connections: int) -> int:
+    """
+    Open connections up front so the first requests don't pay connect latency.
+    
+    Checks out `connections` connections at the same time (so the pool really
+    grows to that size) and returns them to the pool.
+    
+    Args:
+        connections: Number of connections to establish (capped at the pool size)
+        
+    Returns:
+        int: Number of connections opened
+    """
+    engine = get_engine()
+    target = min(connections, engine.pool.size()) if hasattr(engine.pool, "size") else connections
+    opened = []
+    try:
+        for _ in range(target):
+            opened.append(engine.connect())
+    finally:
+        for connection in opened:
+            connection.close()
+    
+    logger.info(f"Database pool warmed up with {len(opened)} connections")
+    return len(opened)
+
+
 def drop_tables() -> bool:
     """
     Drop all database tables (use with caution).
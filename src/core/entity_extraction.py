@@ -7,6 +7,25 @@ import re
 
 logger = get_logger(__name__)
 
+# Fast path: mensagens rotuladas ("nome: ..., telefone: ...") dispensam o LLM
+_FIELD_LABELS = {
+    "nome": "nome", "paciente": "nome",
+    "telefone": "telefone", "tel": "telefone", "celular": "telefone", "fone": "telefone",
+    "data": "data", "dia": "data",
+    "horário": "horario", "horario": "horario", "hora": "horario",
+    "tipo": "tipo_consulta", "tipo de consulta": "tipo_consulta",
+}
+_LABELED_FIELD_RE = re.compile(
+    r'\b(tipo de consulta|paciente|nome|telefone|celular|fone|tel|data|dia|horário|horario|hora|tipo)\s*[:=]\s*([^,;\n]+)',
+    re.IGNORECASE
+)
+_FAST_FIELD_SHAPES = {
+    "nome": re.compile(r"[A-Za-zÀ-ÿ'][A-Za-zÀ-ÿ' .-]{1,99}"),
+    "telefone": re.compile(r"\+?[\d\s().-]{10,20}"),
+    "data": re.compile(r"\d{1,2}/\d{1,2}(/\d{2,4})?|\d{4}-\d{2}-\d{2}"),
+    "horario": re.compile(r"\d{1,2}(:\d{2}|h\d{0,2})"),
+}
+
 
 class EntityExtractor:
     """
@@ -66,13 +85,18 @@ class EntityExtractor:
         Returns:
             Dict: Resultado da extração com dados estruturados e confidence score
         """
-        # Prepara contexto para melhorar extração
-        enhanced_message = self._enhance_message_with_context(message, context)
-        
-        result = await self.openai_client.extract_entities(
-            message=enhanced_message,
-            function_schema=self.consulta_schema
-        )
+        fast_data = self._fast_extract(message)
+        if fast_data is not None:
+            logger.info("Extração via fast path (mensagem rotulada), LLM dispensado")
+            result = {"success": True, "extracted_data": fast_data, "fast_path": True}
+        else:
+            # Prepara contexto para melhorar extração
+            enhanced_message = self._enhance_message_with_context(message, context)
+            
+            result = await self.openai_client.extract_entities(
+                message=enhanced_message,
+                function_schema=self.consulta_schema
+            )
         
         if result["success"]:
             # Combina com dados existentes do contexto
@@ -93,7 +117,7 @@ class EntityExtractor:
                 
                 # Usa dados normalizados e confidence score do normalizador
                 result["extracted_data"] = normalization_result.normalized_data
-                logger.info(f"Entity extraction final result: {result['extracted_data']}")
+                logger.debug("Entity extraction final result: %s", result['extracted_data'])
                 result["confidence_score"] = self._calculate_improved_confidence(
                     normalization_result.normalized_data,
                     normalization_result.validation_summary.field_results,
@@ -116,7 +140,7 @@ class EntityExtractor:
                 if normalization_result.recommendations:
                     result["recommendations"] = normalization_result.recommendations
                 
-                logger.info(f"Normalização aplicada com sucesso. Confidence score: {result['confidence_score']:.2f}")
+                logger.debug("Normalização aplicada com sucesso. Confidence score: %.2f", result['confidence_score'])
                 
             except Exception as e:
                 # Se normalização falhar, usa dados processados e loga warning
@@ -151,10 +175,36 @@ class EntityExtractor:
             result["suggested_questions"] = suggested_questions
             result["is_complete"] = len(missing_fields) == 0
             
-            logger.info(f"Confidence score final: {result['confidence_score']:.2f}")
+            logger.debug("Confidence score final: %.2f", result['confidence_score'])
         
         return result
     
+    def _fast_extract(self, message: str) -> Optional[Dict[str, Any]]:
+        """
+        Extrai campos de mensagens rotuladas sem chamar o LLM.
+        
+        Só retorna dados quando todos os campos obrigatórios (nome, telefone,
+        data, horário) aparecem rotulados e com formato determinístico.
+        
+        Args:
+            message: Mensagem original
+            
+        Returns:
+            Dados no formato do schema de extração, ou None para usar o LLM
+        """
+        extracted = {}
+        for label, value in _LABELED_FIELD_RE.findall(message):
+            field = _FIELD_LABELS[label.lower()]
+            extracted.setdefault(field, value.strip())
+        
+        for field, shape in _FAST_FIELD_SHAPES.items():
+            value = extracted.get(field)
+            if not value or not shape.fullmatch(value):
+                return None
+        
+        extracted.setdefault("tipo_consulta", None)
+        return extracted
+    
     def _enhance_message_with_context(self, message: str, context: Dict[str, Any] = None) -> str:
         """
         Enriquece a mensagem com contexto para melhorar extração.
@@ -398,7 +448,7 @@ class EntityExtractor:
             date_result = self.date_validator.validate(temporal_info["date_expression"])
             if date_result.is_valid:
                 processed_data["data"] = date_result.value
-                logger.info(f"Data processada: {temporal_info['date_expression']} -> {date_result.value}")
+                logger.debug("Data processada: %s -> %s", temporal_info['date_expression'], date_result.value)
         
         # Processa campo de horário se necessário
         if temporal_info["has_time_expression"]:
@@ -406,7 +456,7 @@ class EntityExtractor:
             time_result = self.date_validator.validate(temporal_info["time_expression"])
             if time_result.is_valid:
                 processed_data["horario"] = time_result.value
-                logger.info(f"Horário processado: {temporal_info['time_expression']} -> {time_result.value}")
+                logger.debug("Horário processado: %s -> %s", temporal_info['time_expression'], time_result.value)
         
         # Processa expressões combinadas
         for combined_expr in temporal_info["combined_expressions"]:
@@ -425,7 +475,7 @@ class EntityExtractor:
                     time_result = date_validator.validate_time(time_part)
                     if time_result.is_valid:
                         processed_data["horario"] = time_result.normalized_value
-                        logger.info(f"Expressão combinada processada: {combined_expr} -> data: {date_result.normalized_value}, horário: {time_result.normalized_value}")
+                        logger.debug("Expressão combinada processada: %s -> data: %s, horário: %s", combined_expr, date_result.normalized_value, time_result.normalized_value)
             
             elif "hoje" in combined_expr:
                 # Processa apenas horário para hoje
@@ -434,7 +484,7 @@ class EntityExtractor:
                     time_result = date_validator.validate_time(time_part)
                     if time_result.is_valid:
                         processed_data["horario"] = time_result.normalized_value
-                        logger.info(f"Expressão combinada processada: {combined_expr} -> horário: {time_result.normalized_value}")
+                        logger.debug("Expressão combinada processada: %s -> horário: %s", combined_expr, time_result.normalized_value)
         
         return processed_data
     
@@ -1,5 +1,5 @@
 import logging
-import json
+import orjson
 from datetime import datetime
 
 class JsonFormatter(logging.Formatter):
@@ -10,7 +10,8 @@ class JsonFormatter(logging.Formatter):
             "name": record.name,
             "message": record.getMessage(),
         }
-        return json.dumps(log_record)
+        # orjson emits compact UTF-8 (accents stay readable) and is much cheaper per record
+        return orjson.dumps(log_record, default=str).decode()
 
 def get_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
@@ -1,20 +1,95 @@
-import requests
-import json
+import asyncio
+import httpx
+import orjson
 from typing import Dict, Any, Optional
 from src.core.config import get_settings
+from src.core.cache import ResponseCache
 from src.core.logging.logger_factory import get_logger
 
 logger = get_logger(__name__)
 
+# Shared HTTP client so every OpenAI call reuses pooled keep-alive connections
+_http_client: Optional[httpx.AsyncClient] = None
+
+# Exact-match cache for chat completions (same model + prompt + message)
+_completion_cache: Optional[ResponseCache] = None
+
+# Caps concurrent in-flight OpenAI requests across all clients
+_request_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def get_completion_cache() -> ResponseCache:
+    """
+    Retorna o cache de chat completions, criando-o se necessário.
+    
+    Returns:
+        ResponseCache: Cache compartilhado de respostas do modelo
+    """
+    global _completion_cache
+    if _completion_cache is None:
+        settings = get_settings()
+        _completion_cache = ResponseCache(
+            max_size=settings.RESPONSE_CACHE_MAX_SIZE,
+            ttl_seconds=settings.RESPONSE_CACHE_TTL
+        )
+    return _completion_cache
+
+
+def get_request_semaphore() -> asyncio.Semaphore:
+    """
+    Retorna o semáforo que limita chamadas simultâneas à OpenAI.
+    
+    Returns:
+        asyncio.Semaphore: Semáforo dimensionado por MAX_CONCURRENT_OPENAI
+    """
+    global _request_semaphore
+    if _request_semaphore is None:
+        _request_semaphore = asyncio.Semaphore(get_settings().MAX_CONCURRENT_OPENAI)
+    return _request_semaphore
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Retorna o AsyncClient compartilhado, criando-o se necessário.
+    
+    Returns:
+        httpx.AsyncClient: Cliente HTTP com pool de conexões keep-alive
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        settings = get_settings()
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            # Fail fast on unreachable hosts; the full budget is for the completion itself
+            timeout=httpx.Timeout(settings.OPENAI_TIMEOUT, connect=5.0)
+        )
+        logger.info("AsyncClient HTTP compartilhado criado")
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Fecha o AsyncClient compartilhado (usado no shutdown da aplicação)."""
+    global _http_client, _request_semaphore
+    # Semaphore is bound to the running loop; a new lifespan gets a fresh one
+    _request_semaphore = None
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        logger.info("AsyncClient HTTP compartilhado fechado")
+
 
 class OpenAIClient:
     """
-    Cliente para integração com a API OpenAI usando requests.
+    Cliente para integração com a API OpenAI usando httpx assíncrono.
     """
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
         """
         Inicializa o cliente OpenAI usando configuração centralizada.
+        
+        Args:
+            http_client: AsyncClient opcional para dependency injection.
+                         Se None, usa o cliente compartilhado do módulo.
         """
         # Get centralized settings with all configurations
         settings = get_settings()
@@ -25,6 +100,12 @@ class OpenAIClient:
         self.timeout = settings.OPENAI_TIMEOUT
         self.system_prompt = "Você é um assistente conversacional amigável. Responda de forma natural e útil."
         self.api_url = settings.OPENAI_API_URL
+        self._http_client = http_client
+    
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """AsyncClient usado nas chamadas (injetado ou compartilhado)."""
+        return self._http_client or get_http_client()
     
     async def chat_completion(self, message: str, system_prompt: str = None) -> str:
         """
@@ -55,22 +136,16 @@ class OpenAIClient:
                 "max_tokens": self.max_tokens
             }
             
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                json=data,
-                timeout=self.timeout
+            cache_key = ResponseCache.make_key(self.model, self.max_tokens, prompt, message)
+            return await get_completion_cache().get_or_compute(
+                cache_key,
+                lambda: self._request_completion(headers, data)
             )
             
-            response.raise_for_status()
-            
-            response_data = response.json()
-            return response_data["choices"][0]["message"]["content"]
-            
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             error_message = f"Erro de conexão com a API OpenAI: {str(e)}"
             return error_message
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             error_message = f"Erro ao processar resposta da API: {str(e)}"
             return error_message
         except KeyError as e:
@@ -80,6 +155,31 @@ class OpenAIClient:
             error_message = f"Desculpe, ocorreu um erro ao processar sua mensagem: {str(e)}"
             return error_message
     
+    async def _post(self, headers: Dict[str, str], data: Dict[str, Any]) -> httpx.Response:
+        """Envia a requisição à API respeitando o limite global de concorrência."""
+        async with get_request_semaphore():
+            return await self.http_client.post(
+                self.api_url,
+                headers=headers,
+                # orjson encodes straight to bytes; httpx's json= goes through stdlib json
+                content=orjson.dumps(data),
+                timeout=self.timeout
+            )
+    
+    async def _request_completion(self, headers: Dict[str, str], data: Dict[str, Any]) -> str:
+        """
+        Executa a chamada de chat completion e retorna o conteúdo da resposta.
+        
+        Raises:
+            httpx.HTTPError, orjson.JSONDecodeError, KeyError: tratados pelo chamador
+        """
+        response = await self._post(headers, data)
+        
+        response.raise_for_status()
+        
+        response_data = orjson.loads(response.content)
+        return response_data["choices"][0]["message"]["content"]
+    
     async def extract_entities(self, message: str, function_schema: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extrai entidades de uma mensagem usando OpenAI function calling.
@@ -111,22 +211,17 @@ class OpenAIClient:
                 "max_tokens": self.max_tokens
             }
             
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                json=data,
-                timeout=self.timeout
-            )
+            response = await self._post(headers, data)
             
             response.raise_for_status()
-            response_data = response.json()
+            response_data = orjson.loads(response.content)
             
             # Verifica se o modelo retornou uma function call
             message_response = response_data["choices"][0]["message"]
             
             if "function_call" in message_response:
-                function_args = json.loads(message_response["function_call"]["arguments"])
-                logger.info(f"OpenAI raw function_args: {function_args}")
+                function_args = orjson.loads(message_response["function_call"]["arguments"])
+                logger.debug("OpenAI raw function_args: %s", function_args)
                 
                 # Calcula confidence score baseado na completude dos dados
                 total_fields = len(function_schema["parameters"]["properties"])
@@ -146,12 +241,12 @@ class OpenAIClient:
                     "raw_response": message_response.get("content", "")
                 }
                 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             return {
                 "success": False,
                 "error": f"Erro de conexão com a API OpenAI: {str(e)}"
             }
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             return {
                 "success": False,
                 "error": f"Erro ao processar resposta da API: {str(e)}"
@@ -293,23 +388,18 @@ Resposta: {
                 "temperature": 0.1  # Baixa temperatura para respostas mais consistentes
             }
             
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                json=data,
-                timeout=self.timeout
-            )
+            response = await self._post(headers, data)
             
             response.raise_for_status()
             
-            response_data = response.json()
+            response_data = orjson.loads(response.content)
             llm_response = response_data["choices"][0]["message"]["content"]
             
             # Tenta parsear como JSON, se falhar, retorna resposta estruturada de fallback
             try:
-                parsed_response = json.loads(llm_response)
+                parsed_response = orjson.loads(llm_response)
                 return llm_response
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 # Fallback: retorna JSON estruturado básico
                 fallback_response = {
                     "response": llm_response,
@@ -326,9 +416,9 @@ Resposta: {
                     "validation_errors": [],
                     "missing_fields": []
                 }
-                return json.dumps(fallback_response, ensure_ascii=False)
+                return orjson.dumps(fallback_response).decode()
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             error_response = {
                 "response": f"Desculpe, ocorreu um erro de conexão: {str(e)}",
                 "action": "error",
@@ -338,7 +428,7 @@ Resposta: {
                 "validation_errors": [f"Erro de conexão: {str(e)}"],
                 "missing_fields": []
             }
-            return json.dumps(error_response, ensure_ascii=False)
+            return orjson.dumps(error_response).decode()
         except Exception as e:
             error_response = {
                 "response": f"Desculpe, ocorreu um erro: {str(e)}",
@@ -349,4 +439,4 @@ Resposta: {
                 "validation_errors": [f"Erro interno: {str(e)}"],
                 "missing_fields": []
             }
-            return json.dumps(error_response, ensure_ascii=False)
\ No newline at end of file
+            return orjson.dumps(error_response).decode()
\ No newline at end of file
@@ -3,6 +3,7 @@ ConversationFlow - Gerencia fluxo natural da conversa
 Controla extração de dados, validação e gerenciamento de contexto conversacional.
 """
 
+from collections import ChainMap
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from src.core.logging.logger_factory import get_logger
@@ -49,12 +50,12 @@ class ConversationFlow:
         Agora antecipa próximos campos necessários e evita re-extrações desnecessárias.
         """
         try:
-            logger.info(f"Extraindo dados da mensagem: '{message[:50]}...'")
+            logger.debug("Extraindo dados da mensagem: '%.50s...'", message)
 
             # Verifica se já temos todos os dados necessários
             missing_fields = self._anticipate_next_steps(context)
             if not missing_fields:
-                logger.info("Todos os campos necessários já foram preenchidos. Nenhuma extração necessária.")
+                logger.debug("Todos os campos necessários já foram preenchidos. Nenhuma extração necessária.")
                 return {
                     "action": "skip",
                     "extracted_data": context.get("extracted_data", {}),
@@ -77,7 +78,7 @@ class ConversationFlow:
                     
                     if has_english_fields:
                         # Data already normalized by entity_extraction
-                        logger.info("Data already normalized by entity_extraction, using as-is")
+                        logger.debug("Data already normalized by entity_extraction, using as-is")
                         normalized_data = extracted_data
                     else:
                         # Data needs normalization
@@ -86,7 +87,7 @@ class ConversationFlow:
                     confidence = extraction_result.get("confidence", 0.0)
                     anticipated_next = self._anticipate_next_steps(context, normalized_data)
                     progression_pattern = self._detect_data_progression(context, normalized_data)
-                    logger.info(f"Dados extraídos: {list(normalized_data.keys())}, Confidence: {confidence:.2f}")
+                    logger.debug("Dados extraídos: %s, Confidence: %.2f", list(normalized_data), confidence)
                     return {
                         "action": "extract",
                         "extracted_data": normalized_data,
@@ -96,7 +97,7 @@ class ConversationFlow:
                         "progression_pattern": progression_pattern
                     }
                 else:
-                    logger.info("Nenhum dado extraído da mensagem")
+                    logger.debug("Nenhum dado extraído da mensagem")
                     anticipated_next = self._anticipate_next_steps(context)
                     progression_pattern = self._detect_data_progression(context)
                     return {
@@ -144,13 +145,13 @@ class ConversationFlow:
             Dict: Resultado da validação
         """
         try:
-            logger.info(f"Validando dados: {list(extracted_data.keys())}")
+            logger.debug("Validando dados: %s", list(extracted_data))
             
             # Valida dados usando ValidationOrchestrator
             validation_summary = self.validation_orchestrator.validate_data(extracted_data)
             
             if validation_summary.is_valid:
-                logger.info("Dados validados com sucesso")
+                logger.debug("Dados validados com sucesso")
                 return {
                     "action": "validate",
                     "is_valid": True,
@@ -191,7 +192,7 @@ class ConversationFlow:
                     context["extracted_data"][key] = value
                 elif key not in context["extracted_data"]:
                     context["extracted_data"][key] = value
-            logger.info(f"Contexto atualizado (merge) com dados: {list(extracted_data.keys())}")
+            logger.debug("Contexto atualizado (merge) com dados: %s", list(extracted_data))
 
         # Atualiza métricas de confidence
         confidence = act_result.get("confidence", 0.0)
@@ -306,9 +307,10 @@ class ConversationFlow:
         """
         # Campos obrigatórios para consulta
         required_fields = ["nome", "telefone", "data", "horario", "tipo_consulta"]
-        extracted = context.get("extracted_data", {}).copy()
+        extracted = context.get("extracted_data", {})
         if new_data:
-            extracted.update(new_data)
+            # Read-only merged view (new data wins) instead of copying the session data
+            extracted = ChainMap(new_data, extracted)
         missing = [field for field in required_fields if not extracted.get(field)]
         return missing
 
@@ -34,7 +34,7 @@ class FallbackHandler:
             Dict: Resultado da análise com ação decidida
         """
         try:
-            logger.info("Executando análise com fallback Python...")
+            logger.debug("Executando análise com fallback Python...")
             
             # Normaliza mensagem
             message_lower = message.lower().strip()
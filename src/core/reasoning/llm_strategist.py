@@ -73,7 +73,7 @@ class LLMStrategist:
             Dict: Resultado completo do processamento
         """
         try:
-            logger.info("Iniciando LLM reasoning otimizado...")
+            logger.debug("Iniciando LLM reasoning otimizado...")
             
             existing_data = context.get("extracted_data", {})
             conversation_history = context.get("conversation_history", [])
@@ -135,14 +135,14 @@ Processe esta mensagem completamente e retorne o JSON estruturado."""
                 message=user_prompt,
                 system_prompt=system_prompt
             )
-            logger.info(f"[DEBUG] Resposta bruta do LLM: {response}")
+            logger.debug("Resposta bruta do LLM: %s", response)
             if isinstance(response, str):
                 try:
-                    logger.info(f"[DEBUG] Tentando parsear resposta do LLM como JSON...")
+                    logger.debug("Tentando parsear resposta do LLM como JSON...")
                     result = json.loads(response)
-                    logger.info(f"[DEBUG] JSON parseado com sucesso: {result}")
+                    logger.debug("JSON parseado com sucesso: %s", result)
                     if "action" in result and "confidence_score" in result and "extracted_data" in result:
-                        logger.info(f"LLM reasoning otimizado bem-sucedido: {result['action']}")
+                        logger.debug("LLM reasoning otimizado bem-sucedido: %s", result['action'])
                         return {
                             "action": result["action"],
                             "confidence": result["confidence_score"],  # Mapeia confidence_score para confidence
@@ -41,7 +41,7 @@ class ReasoningCoordinator:
             Dict: Resultado do processamento com ação, resposta e dados
         """
         try:
-            logger.info(f"Coordenador iniciando processamento otimizado: '{message[:50]}...'")
+            logger.debug("Coordenador iniciando processamento otimizado: '%.50s...'", message)
             
             # Inicializa contexto se não fornecido
             if context is None:
@@ -49,7 +49,7 @@ class ReasoningCoordinator:
             
             # PROCESSAMENTO OTIMIZADO: LLMStrategist faz tudo
             llm_result = await self.llm_strategist.analyze_message(message, context)
-            logger.debug(f"LLM Result: {llm_result}")
+            logger.debug("LLM Result: %s", llm_result)
             
             if llm_result["action"] == "error":
                 return self._create_error_response("Erro na análise da mensagem", llm_result.get("error"))
@@ -57,7 +57,7 @@ class ReasoningCoordinator:
             # Atualiza contexto com resultados do LLM
             self._update_context_with_llm_results(context, llm_result)
             
-            logger.info(f"Coordenador concluído. Ação: {llm_result['action']}, Confidence: {llm_result.get('confidence', 0.0):.2f}")
+            logger.debug("Coordenador concluído. Ação: %s, Confidence: %.2f", llm_result['action'], llm_result.get('confidence', 0.0))
             return llm_result
             
         except Exception as e:
@@ -88,7 +88,7 @@ class ReasoningCoordinator:
             for key, value in extracted_data.items():
                 if value is not None and value != "":
                     context["extracted_data"][key] = value
-            logger.info(f"Contexto atualizado com dados: {list(extracted_data.keys())}")
+            logger.debug("Contexto atualizado com dados: %s", list(extracted_data))
 
         # Atualiza métricas de confidence
         confidence = llm_result.get("confidence", 0.0)
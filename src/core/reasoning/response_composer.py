@@ -3,6 +3,7 @@ ResponseComposer - Compõe respostas naturais e contextuais
 Gera respostas conversacionais baseadas no contexto e resultados do reasoning.
 """
 
+from collections import ChainMap
 from typing import Dict, Any, Optional, List
 import random
 from src.core.logging.logger_factory import get_logger
@@ -375,8 +376,8 @@ class ResponseComposer:
         """
         Gera próxima pergunta com progressão contextual fluida e baseada no padrão de progressão.
         """
-        all_data = context.get("extracted_data", {}).copy()
-        all_data.update(extracted_data)
+        # Read-only merged view (new data wins) instead of copying the session data
+        all_data = ChainMap(extracted_data, context.get("extracted_data", {}))
         missing_fields = self._get_missing_fields(all_data)
         progression_pattern = context.get("progression_pattern", "indefinido")
         if not missing_fields:
@@ -131,8 +131,8 @@ class DataNormalizer:
             
             # Mapeia campos para nomenclatura padrão
             mapped_data = self.field_mapper.map_data(data)
-            logger.info(f"Data normalizer - Original data: {data}")
-            logger.info(f"Data normalizer - Mapped data: {mapped_data}")
+            logger.debug("Data normalizer - Original data: %s", data)
+            logger.debug("Data normalizer - Mapped data: %s", mapped_data)
             
             # Valida dados mapeados
             required_fields = self.field_mapper.get_required_fields()
@@ -159,7 +159,7 @@ class DataNormalizer:
             success = validation_summary.is_valid and len(field_mapping_info["missing_required"]) == 0
             
             # Log final normalized data
-            logger.info(f"Data normalizer - Final normalized data: {validation_summary.normalized_data}")
+            logger.debug("Data normalizer - Final normalized data: %s", validation_summary.normalized_data)
             
             return NormalizationResult(
                 success=success,
@@ -5,11 +5,11 @@ This model represents logs of entity extraction operations for debugging and ana
 """
 
 import uuid
-from datetime import datetime
 from sqlalchemy import Column, Integer, String, Text, DateTime, DECIMAL, JSON
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 
+from src.core import clock
 from src.core.database import Base
 
 
@@ -79,7 +79,7 @@ class ExtractionLog(Base):
         step = {
             'type': step_type,
             'description': description,
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': clock.utcnow_iso(),
             'data': data or {}
         }
         
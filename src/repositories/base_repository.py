@@ -59,6 +59,45 @@ class BaseRepository(Generic[T]):
             self.logger.error(f"Unexpected error creating {self.model.__name__}: {str(e)}")
             raise
     
+    def create_many(self, data_list: List[Dict[str, Any]]) -> List[T]:
+        """
+        Create several records in a single transaction.
+        
+        Rows are inserted with one flush, committed once and reloaded with a
+        single SELECT, instead of the commit + refresh round-trips per row
+        that create() performs.
+        
+        Args:
+            data_list: List of dictionaries with the data for each record
+            
+        Returns:
+            The created model instances, in input order
+            
+        Raises:
+            SQLAlchemyError: If database operation fails (nothing is persisted)
+        """
+        try:
+            instances = [self.model(**data) for data in data_list]
+            self.session.add_all(instances)
+            self.session.flush()
+            ids = [instance.id for instance in instances]
+            self.session.commit()
+            
+            # Reload every expired instance with one query
+            self.session.query(self.model).filter(self.model.id.in_(ids)).all()
+            
+            self.logger.info(f"Created {len(instances)} {self.model.__name__} records in one transaction")
+            return instances
+            
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            self.logger.error(f"Error creating {self.model.__name__} batch: {str(e)}")
+            raise
+        except Exception as e:
+            self.session.rollback()
+            self.logger.error(f"Unexpected error creating {self.model.__name__} batch: {str(e)}")
+            raise
+    
     def get(self, id: int) -> Optional[T]:
         """
         Retrieve a record by its ID.
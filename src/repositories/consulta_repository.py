@@ -2,7 +2,7 @@ from src.repositories.base_repository import BaseRepository
 from src.models.consulta import Consulta
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 from datetime import datetime
 import uuid
 import logging
@@ -78,7 +78,7 @@ class ConsultaRepository(BaseRepository[Consulta]):
                 Consulta.session_id == session_id
             ).order_by(Consulta.created_at.desc()).all()
             
-            self.logger.info(f"Found {len(consultas)} consultas for session {session_id}")
+            self.logger.debug("Found %d consultas for session %s", len(consultas), session_id)
             return consultas
             
         except SQLAlchemyError as e:
@@ -277,7 +277,7 @@ class ConsultaRepository(BaseRepository[Consulta]):
                 Consulta.created_at.desc()
             ).limit(limit).all()
             
-            self.logger.info(f"Retrieved {len(consultas)} recent consultas (limit: {limit})")
+            self.logger.debug("Retrieved %d recent consultas (limit: %s)", len(consultas), limit)
             return consultas
             
         except SQLAlchemyError as e:
@@ -285,4 +285,31 @@ class ConsultaRepository(BaseRepository[Consulta]):
             raise
         except Exception as e:
             self.logger.error(f"Unexpected error retrieving recent consultas: {str(e)}")
+            raise
+    
+    def iter_recent_consultas(self, limit: int = 10, batch_size: int = 100) -> Iterator[Consulta]:
+        """
+        Iterate over the most recent consultas without loading them all at once.
+        
+        Rows are fetched from the database in batches of batch_size, so memory
+        stays bounded by the batch rather than by limit.
+        
+        Args:
+            limit: Maximum number of recent consultas to yield
+            batch_size: Number of rows fetched per round trip
+            
+        Yields:
+            Consulta instances, most recent first
+            
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        try:
+            query = self.session.query(Consulta).order_by(
+                Consulta.created_at.desc()
+            ).limit(limit).yield_per(batch_size)
+            yield from query
+            
+        except SQLAlchemyError as e:
+            self.logger.error(f"Error streaming recent consultas: {str(e)}")
             raise 
\ No newline at end of file
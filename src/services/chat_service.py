@@ -8,17 +8,42 @@ This service coordinates the complete conversation flow including:
 - Integration with other services
 """
 
-from typing import Dict, Any, Optional
 from datetime import datetime
-import json
+from typing import Dict, Any, Optional
+import asyncio
 import logging
-from src.core.container import get_openai_client, get_consultation_service
-from src.core.reasoning.reasoning_coordinator import ReasoningCoordinator
+import orjson
+from src.core.container import get_openai_client, get_consultation_service, get_reasoning_coordinator
 from src.core.config import get_settings
 from src.services.session_service import SessionService
+from src.core.id_pool import new_id
+from src.core import clock
 
 logger = logging.getLogger(__name__)
 
+# Fixed fields of a new session; copied per session instead of rebuilding the literal
+_SESSION_TEMPLATE = {
+    "session_start": None,
+    "conversation_history": None,
+    "extracted_data": None,
+    "total_confidence": 0.0,
+    "confidence_count": 0,
+    "average_confidence": 0.0
+}
+
+# Reply for unexpected failures; exception details go to the log, never to the client
+_GENERIC_ERROR = "Ocorreu um erro ao processar sua mensagem."
+
+# Actions whose extracted data is persisted as a consultation
+_PERSISTABLE_ACTIONS = frozenset(("extract", "confirm", "complete"))
+
+# Success suffix appended to the reply per persisting action
+_PERSISTENCE_SUCCESS_MESSAGES = {
+    "extract": "\n\n✅ Consulta registrada com sucesso! (ID: {})",
+    "confirm": "\n\n✅ Consulta confirmada e salva! (ID: {})",
+    "complete": "\n\n✅ Consulta completa registrada com sucesso! (ID: {})",
+}
+
 
 class ChatService:
     """
@@ -32,6 +57,11 @@ class ChatService:
         """Initialize ChatService with required dependencies."""
         self.session_service = session_service or SessionService()
         self.settings = get_settings()
+        # Persistence launched in the background, by session (CHAT_ASYNC_PERSISTENCE)
+        self.async_persistence = self.settings.CHAT_ASYNC_PERSISTENCE
+        self._persistence_tasks: Dict[str, asyncio.Task] = {}
+        # Upper bound for the LLM/reasoning stage (CHAT_REQUEST_TIMEOUT); persistence runs outside it
+        self.llm_timeout = self.settings.CHAT_REQUEST_TIMEOUT
         logger.info("ChatService initialized successfully")
     
     async def process_message(self, message: str, session_id: Optional[str] = None) -> Dict[str, Any]:
@@ -44,64 +74,83 @@ class ChatService:
             
         Returns:
             Dictionary containing complete response data
+            
+        Raises:
+            TimeoutError: If the LLM/reasoning stage exceeds CHAT_REQUEST_TIMEOUT
         """
-        logger.info(f"Processing message: {message[:50]}...")
+        logger.debug("Processing message: %.50s...", message)
+        
+        # Single timestamp shared by the session, history entry and response
+        now = clock.utcnow()
+        context = None
         
         try:
             # Get or create session context
-            context = self._get_or_create_session_context(session_id)
+            context = self._get_or_create_session_context(session_id, now)
+            # Errors past this point still answer with the session the client is in
+            session_id = context["session_id"]
             
             # Process message based on configuration
             if getattr(self.settings, "USE_FULL_LLM_VALIDATION", False):
-                result = await self._process_with_full_llm(message, context)
+                result = await self._process_with_full_llm(message, context, now)
             else:
-                result = await self._process_with_reasoning_engine(message, context)
+                result = await self._process_with_reasoning_engine(message, context, now)
             
-            # Update session context
+            # context is the stored dict itself (no copy); this call renews the
+            # TTL, the LRU position and the precomputed listing summary
             self.session_service.update_session(context["session_id"], context)
             
             return result
             
+        except TimeoutError:
+            # Raised before any persistence started; the caller answers 504
+            if context is not None:
+                self.session_service.update_session(context["session_id"], context)
+            raise
         except Exception as e:
-            logger.error(f"Error processing message: {e}")
-            return self._create_error_response(str(e), session_id)
+            logger.exception("Error processing message")
+            return self._create_error_response(None, session_id, now)
     
-    def _get_or_create_session_context(self, session_id: Optional[str] = None) -> Dict[str, Any]:
+    def _get_or_create_session_context(self, session_id: Optional[str] = None, now: Optional[datetime] = None) -> Dict[str, Any]:
         """Get existing session context or create new one."""
+        now = now or clock.utcnow()
         if not session_id:
-            session_id = f"session_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
+            # Pooled hex id: unique per conversation (second-resolution timestamps
+            # collided) and parseable as the UUID stored with persisted consultations
+            session_id = new_id()
         
         context = self.session_service.get_session(session_id)
         if context is None:
-            context = self.session_service.create_session(session_id, {
-                "session_start": datetime.utcnow().isoformat(),
-                "conversation_history": [],
-                "extracted_data": {},
-                "total_confidence": 0.0,
-                "confidence_count": 0,
-                "average_confidence": 0.0
-            })
-            logger.info(f"New session created: {session_id}")
+            initial_context = _SESSION_TEMPLATE.copy()
+            initial_context["session_start"] = clock.isoformat(now)
+            initial_context["conversation_history"] = []
+            initial_context["extracted_data"] = {}
+            context = self.session_service.create_session(session_id, initial_context)
+            logger.debug("New session created: %s", session_id)
         else:
-            logger.info(f"Existing session retrieved: {session_id}")
+            logger.debug("Existing session retrieved: %s", session_id)
         
         context["session_id"] = session_id
         return context
     
-    async def _process_with_full_llm(self, message: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def _process_with_full_llm(self, message: str, context: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, Any]:
         """Process message using full LLM approach."""
-        logger.info("[Feature Toggle] Using FULL_LLM_VALIDATION mode")
+        logger.debug("[Feature Toggle] Using FULL_LLM_VALIDATION mode")
+        now = now or clock.utcnow()
         
         openai_client = get_openai_client()
         if openai_client is None:
-            return self._create_error_response("AI service unavailable", context["session_id"])
+            return self._create_error_response("AI service unavailable", context["session_id"], now)
         
         try:
             # Get LLM response
-            ai_response = await openai_client.full_llm_completion(message, context)
+            ai_response = await asyncio.wait_for(
+                openai_client.full_llm_completion(message, context),
+                timeout=self.llm_timeout
+            )
             
             # Parse LLM response
-            llm_data = json.loads(ai_response) if isinstance(ai_response, str) else ai_response
+            llm_data = orjson.loads(ai_response) if isinstance(ai_response, (str, bytes)) else ai_response
             
             # Extract response components
             extracted_data = llm_data.get("extracted_data", {})
@@ -119,13 +168,13 @@ class ChatService:
                 "user_message": message,
                 "action": action,
                 "confidence": confidence,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": clock.isoformat(now)
             })
             
             return {
                 "response": response_text,
                 "session_id": context["session_id"],
-                "timestamp": datetime.utcnow(),
+                "timestamp": now,
                 "action": action,
                 "extracted_data": extracted_data,
                 "confidence": confidence,
@@ -134,22 +183,28 @@ class ChatService:
                 "persistence_status": "not_applicable"
             }
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Error parsing LLM response: {e}")
-            return self._create_error_response("Error processing AI response", context["session_id"])
+            return self._create_error_response("Error processing AI response", context["session_id"], now)
     
-    async def _process_with_reasoning_engine(self, message: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def _process_with_reasoning_engine(self, message: str, context: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, Any]:
         """Process message using reasoning engine approach."""
-        logger.info("Using ReasoningCoordinator mode")
+        logger.debug("Using ReasoningCoordinator mode")
+        now = now or clock.utcnow()
         
-        reasoning_engine = ReasoningCoordinator()
+        # Shared coordinator from the container (building one per message set up all its components)
+        reasoning_engine = get_reasoning_coordinator()
         if reasoning_engine is None:
             logger.warning("Reasoning Engine unavailable, using OpenAI fallback")
-            return await self._process_with_openai_fallback(message, context)
+            return await self._process_with_openai_fallback(message, context, now)
         
         try:
-            # Process with reasoning engine
-            result = await reasoning_engine.process_message(message, context)
+            # Process with reasoning engine; only this stage is bounded, so a
+            # timeout can never abandon a consultation insert half-way
+            result = await asyncio.wait_for(
+                reasoning_engine.process_message(message, context),
+                timeout=self.llm_timeout
+            )
             
             # Extract result components
             action = result.get("action", "unknown")
@@ -159,9 +214,14 @@ class ChatService:
             next_questions = result.get("next_questions", [])
             
             # Handle persistence if applicable
-            consultation_id, persistence_status = await self._handle_persistence(
-                message, context["session_id"], extracted_data, action
-            )
+            if self.async_persistence and extracted_data and action in _PERSISTABLE_ACTIONS:
+                # Reply now; GET /chat/persist-status/{session_id} reports the outcome
+                self._start_background_persistence(message, context, extracted_data, action)
+                consultation_id, persistence_status = None, "pending"
+            else:
+                consultation_id, persistence_status = await self._handle_persistence(
+                    message, context["session_id"], extracted_data, action
+                )
             
             # Update response text with persistence info
             if persistence_status == "success":
@@ -172,7 +232,7 @@ class ChatService:
             return {
                 "response": response_text,
                 "session_id": context["session_id"],
-                "timestamp": datetime.utcnow(),
+                "timestamp": now,
                 "action": action,
                 "extracted_data": extracted_data,
                 "confidence": confidence,
@@ -181,21 +241,27 @@ class ChatService:
                 "persistence_status": persistence_status
             }
             
+        except TimeoutError:
+            raise
         except Exception as e:
-            logger.error(f"Error in reasoning engine: {e}")
-            return await self._process_with_openai_fallback(message, context)
+            logger.exception("Error in reasoning engine, using OpenAI fallback")
+            return await self._process_with_openai_fallback(message, context, now)
     
-    async def _process_with_openai_fallback(self, message: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def _process_with_openai_fallback(self, message: str, context: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, Any]:
         """Fallback processing using OpenAI directly."""
+        now = now or clock.utcnow()
         openai_client = get_openai_client()
         if openai_client is None:
-            return self._create_error_response("AI service unavailable", context["session_id"])
+            return self._create_error_response("AI service unavailable", context["session_id"], now)
         
-        ai_response = await openai_client.chat_completion(message)
+        ai_response = await asyncio.wait_for(
+            openai_client.chat_completion(message),
+            timeout=self.llm_timeout
+        )
         return {
             "response": ai_response,
             "session_id": context["session_id"],
-            "timestamp": datetime.utcnow(),
+            "timestamp": now,
             "action": "fallback",
             "extracted_data": {},
             "confidence": 0.0,
@@ -206,7 +272,7 @@ class ChatService:
     
     async def _handle_persistence(self, message: str, session_id: str, extracted_data: Dict[str, Any], action: str) -> tuple:
         """Handle data persistence if applicable."""
-        if not extracted_data or action not in ["extract", "confirm", "complete"]:
+        if not extracted_data or action not in _PERSISTABLE_ACTIONS:
             return None, "not_applicable"
         
         consultation_service = get_consultation_service()
@@ -222,16 +288,60 @@ class ChatService:
             
             if persistence_result.get("success", False):
                 consultation_id = persistence_result.get("consultation_id")
-                logger.info(f"✅ Consultation persisted successfully - ID: {consultation_id}")
+                logger.info("✅ Consultation persisted successfully - ID: %s", consultation_id)
                 return consultation_id, "success"
             else:
-                logger.warning(f"❌ Persistence failed: {persistence_result.get('errors', [])}")
+                logger.warning("❌ Persistence failed: %s", persistence_result.get("errors", []))
                 return None, "failed"
                 
         except Exception as e:
-            logger.error(f"Error during persistence: {e}")
+            logger.exception("Error during persistence")
             return None, "error"
     
+    def _start_background_persistence(self, message: str, context: Dict[str, Any], extracted_data: Dict[str, Any], action: str) -> None:
+        """Persist in a background task; the outcome is stored in the session context."""
+        session_id = context["session_id"]
+        
+        async def persist() -> None:
+            consultation_id, persistence_status = await self._handle_persistence(
+                message, session_id, extracted_data, action
+            )
+            context["last_persistence"] = {
+                "persistence_status": persistence_status,
+                "consultation_id": consultation_id
+            }
+        
+        task = asyncio.get_running_loop().create_task(persist())
+        self._persistence_tasks[session_id] = task
+        
+        def forget(done: asyncio.Task) -> None:
+            if self._persistence_tasks.get(session_id) is done:
+                del self._persistence_tasks[session_id]
+        
+        task.add_done_callback(forget)
+    
+    async def get_persistence_status(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the outcome of the session's latest background persistence.
+        
+        Waits for the task if it is still running.
+        
+        Args:
+            session_id: Session whose persistence status is requested
+            
+        Returns:
+            Dictionary with persistence_status and consultation_id, or None if the session does not exist
+        """
+        task = self._persistence_tasks.get(session_id)
+        if task is not None:
+            # shield: a client disconnecting must not cancel the insert itself
+            await asyncio.shield(task)
+        
+        context = self.session_service.get_session(session_id)
+        if context is None:
+            return None
+        return context.get("last_persistence", {"persistence_status": "not_applicable", "consultation_id": None})
+    
     def _update_context_with_data(self, context: Dict[str, Any], extracted_data: Dict[str, Any], confidence: float) -> None:
         """Update session context with new extracted data and confidence metrics."""
         # Update extracted data
@@ -247,24 +357,21 @@ class ChatService:
     
     def _add_persistence_success_message(self, response_text: str, action: str, consultation_id: int) -> str:
         """Add persistence success message to response."""
-        if action == "extract":
-            return f"{response_text}\n\n✅ Consulta registrada com sucesso!"
-        elif action == "confirm":
-            return f"{response_text}\n\n✅ Consulta confirmada e salva!"
-        elif action == "complete":
-            return f"{response_text}\n\n✅ Consulta completa registrada com sucesso!"
-        return response_text
+        template = _PERSISTENCE_SUCCESS_MESSAGES.get(action)
+        if template is None:
+            return response_text
+        return response_text + template.format(consultation_id)
     
     def _add_persistence_error_message(self, response_text: str, errors: list) -> str:
         """Add persistence error message to response."""
         return f"{response_text}\n\n⚠️ Não foi possível salvar a consulta: {', '.join(errors)}"
     
-    def _create_error_response(self, error_message: str, session_id: str) -> Dict[str, Any]:
-        """Create error response structure."""
+    def _create_error_response(self, error_message: Optional[str], session_id: str, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Create error response structure (generic text when error_message is None)."""
         return {
-            "response": f"Ocorreu um erro ao processar sua mensagem: {error_message}",
+            "response": f"Ocorreu um erro ao processar sua mensagem: {error_message}" if error_message else _GENERIC_ERROR,
             "session_id": session_id,
-            "timestamp": datetime.utcnow(),
+            "timestamp": now or clock.utcnow(),
             "action": "error",
             "extracted_data": {},
             "confidence": 0.0,
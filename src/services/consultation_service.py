@@ -9,8 +9,9 @@ from src.repositories.consulta_repository import ConsultaRepository
 from src.core.entity_extraction import EntityExtractor
 from src.core.validation.normalizers.data_normalizer import DataNormalizer
 from src.core.database import get_session_factory
+from src.services.consultation_writer import ConsultationWriter
 from sqlalchemy.orm import Session
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List
 import uuid
 import logging
 from datetime import datetime
@@ -27,16 +28,20 @@ class ConsultationService:
     data normalization, validation, and database persistence.
     """
     
-    def __init__(self, entity_extractor: Optional[EntityExtractor] = None):
+    def __init__(self, entity_extractor: Optional[EntityExtractor] = None, writer: Optional[ConsultationWriter] = None):
         """
         Initialize the ConsultationService with required components.
         
         Args:
             entity_extractor: EntityExtractor opcional para dependency injection
+            writer: ConsultationWriter opcional (group commit dos inserts)
         """
         self.entity_extractor = entity_extractor or EntityExtractor()
         self.data_normalizer = DataNormalizer()
         self.session_factory = get_session_factory()
+        self.writer = writer or ConsultationWriter(self.session_factory)
+        # Incremented on every write so read caches know when to invalidate
+        self.data_version = 0
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         
         self.logger.info("ConsultationService initialized successfully")
@@ -66,7 +71,7 @@ class ConsultationService:
             - metadata: Additional processing metadata
         """
         start_time = datetime.now()
-        self.logger.info(f"Starting consultation processing for message: {message[:100]}...")
+        self.logger.debug("Starting consultation processing for message: %.100s...", message)
         
         try:
             # Convert session_id to UUID if provided as string
@@ -84,7 +89,7 @@ class ConsultationService:
             
             if extracted_data:
                 # Use provided extracted data
-                self.logger.info("Using provided extracted data")
+                self.logger.debug("Using provided extracted data")
                 extraction_result = {
                     "success": True,
                     "extracted_data": extracted_data,
@@ -114,7 +119,7 @@ class ConsultationService:
             extracted_data = extraction_result.get("extracted_data", {})
             confidence_score = extraction_result.get("confidence_score", 0.0)
             
-            self.logger.info(f"Entity extraction successful. Confidence: {confidence_score}")
+            self.logger.debug("Entity extraction successful. Confidence: %s", confidence_score)
             self.logger.debug(f"Extracted data: {extracted_data}")
             
             # Step 2: Normalize and validate data (skip if already normalized)
@@ -125,7 +130,7 @@ class ConsultationService:
             
             if has_english_fields:
                 # Data already normalized, use as-is
-                self.logger.info("Data already normalized, skipping re-normalization")
+                self.logger.debug("Data already normalized, skipping re-normalization")
                 normalized_data = extracted_data
                 validation_errors = []
                 normalized_confidence = confidence_score
@@ -142,7 +147,7 @@ class ConsultationService:
             # Use the higher confidence score between extraction and normalization
             final_confidence = max(confidence_score, normalized_confidence)
             
-            self.logger.info(f"Data normalization completed. Confidence: {final_confidence}")
+            self.logger.debug("Data normalization completed. Confidence: %s", final_confidence)
             if validation_errors:
                 self.logger.warning(f"Validation errors found: {validation_errors}")
             
@@ -182,54 +187,49 @@ class ConsultationService:
             # Step 4: Persist to database
             self.logger.debug("Step 4: Persisting consultation to database")
             
-            with self.session_factory() as session:
-                try:
-                    repository = ConsultaRepository(session)
-                    consulta = repository.create(consulta_data)
-                    
-                    # Commit the transaction
-                    session.commit()
-                    
-                    self.logger.info(f"Consultation persisted successfully with ID: {consulta.id}")
-                    
-                    # Prepare success response
-                    result = {
-                        "success": True,
-                        "consultation_id": consulta.id,
-                        "data": consulta.to_dict(),
-                        "confidence": final_confidence,
-                        "errors": validation_errors,  # Include validation warnings
-                        "metadata": {
-                            "processing_time": (datetime.now() - start_time).total_seconds(),
-                            "extraction_confidence": confidence_score,
-                            "normalization_confidence": normalized_confidence,
-                            "final_confidence": final_confidence,
-                            "session_id": str(session_uuid) if session_uuid else None,
-                            "timestamp": datetime.now().isoformat(),
-                            "missing_fields": extraction_result.get("missing_fields", []),
-                            "suggested_questions": extraction_result.get("suggested_questions", [])
-                        }
-                    }
-                    
-                    self.logger.info(f"Consultation processing completed successfully in {(datetime.now() - start_time).total_seconds():.2f}s")
-                    return result
-                    
-                except Exception as e:
-                    session.rollback()
-                    error_msg = f"Database persistence failed: {str(e)}"
-                    self.logger.error(error_msg, exc_info=True)
-                    return {
-                        "success": False,
-                        "consultation_id": None,
-                        "data": normalized_data,
-                        "confidence": final_confidence,
-                        "errors": [error_msg] + validation_errors,
-                        "metadata": {
-                            "processing_time": (datetime.now() - start_time).total_seconds(),
-                            "step_failed": "persistence",
-                            "timestamp": datetime.now().isoformat()
-                        }
+            # Inserts from concurrent requests share one transaction (group commit)
+            try:
+                consulta = await self.writer.submit(consulta_data)
+            except Exception as e:
+                error_msg = f"Database persistence failed: {str(e)}"
+                self.logger.error(error_msg, exc_info=True)
+                return {
+                    "success": False,
+                    "consultation_id": None,
+                    "data": normalized_data,
+                    "confidence": final_confidence,
+                    "errors": [error_msg] + validation_errors,
+                    "metadata": {
+                        "processing_time": (datetime.now() - start_time).total_seconds(),
+                        "step_failed": "persistence",
+                        "timestamp": datetime.now().isoformat()
                     }
+                }
+            
+            self.data_version += 1
+            self.logger.info(f"Consultation persisted successfully with ID: {consulta['id']}")
+            
+            # Prepare success response
+            result = {
+                "success": True,
+                "consultation_id": consulta["id"],
+                "data": consulta,
+                "confidence": final_confidence,
+                "errors": validation_errors,  # Include validation warnings
+                "metadata": {
+                    "processing_time": (datetime.now() - start_time).total_seconds(),
+                    "extraction_confidence": confidence_score,
+                    "normalization_confidence": normalized_confidence,
+                    "final_confidence": final_confidence,
+                    "session_id": str(session_uuid) if session_uuid else None,
+                    "timestamp": datetime.now().isoformat(),
+                    "missing_fields": extraction_result.get("missing_fields", []),
+                    "suggested_questions": extraction_result.get("suggested_questions", [])
+                }
+            }
+            
+            self.logger.info(f"Consultation processing completed successfully in {(datetime.now() - start_time).total_seconds():.2f}s")
+            return result
         
         except Exception as e:
             error_msg = f"Unexpected error in consultation processing: {str(e)}"
@@ -257,7 +257,7 @@ class ConsultationService:
         Returns:
             Dictionary representation of the consultation or None if not found
         """
-        self.logger.info(f"Retrieving consultation with ID: {id}")
+        self.logger.debug("Retrieving consultation with ID: %s", id)
         
         try:
             with self.session_factory() as session:
@@ -265,7 +265,7 @@ class ConsultationService:
                 consulta = repository.get(id)
                 
                 if consulta:
-                    self.logger.info(f"Consultation {id} retrieved successfully")
+                    self.logger.debug("Consultation %s retrieved successfully", id)
                     return consulta.to_dict()
                 else:
                     self.logger.warning(f"Consultation {id} not found")
@@ -287,7 +287,7 @@ class ConsultationService:
         Returns:
             List of consultation dictionaries ordered by most recent first
         """
-        self.logger.info(f"Listing consultations (skip: {skip}, limit: {limit})")
+        self.logger.debug("Listing consultations (skip: %s, limit: %s)", skip, limit)
         
         try:
             with self.session_factory() as session:
@@ -296,7 +296,7 @@ class ConsultationService:
                 consultas = repository.get_recent_consultas(limit=limit)
                 
                 result = [consulta.to_dict() for consulta in consultas]
-                self.logger.info(f"Retrieved {len(result)} consultations (most recent first)")
+                self.logger.debug("Retrieved %d consultations (most recent first)", len(result))
                 return result
                 
         except Exception as e:
@@ -304,6 +304,24 @@ class ConsultationService:
             self.logger.error(error_msg, exc_info=True)
             return []
     
+    def iter_consultations(self, limit: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Stream consultations, most recent first, fetching rows in batches.
+        
+        Unlike list_consultations, database errors are raised to the caller,
+        since part of the output may already have been sent.
+        
+        Args:
+            limit: Maximum number of records to yield
+            
+        Yields:
+            Consultation dictionaries ordered by most recent first
+        """
+        with self.session_factory() as session:
+            repository = ConsultaRepository(session)
+            for consulta in repository.iter_recent_consultas(limit=limit):
+                yield consulta.to_dict()
+    
     def get_consultations_by_session(self, session_id: str) -> List[Dict[str, Any]]:
         """
         Get all consultations for a specific session.
@@ -314,7 +332,7 @@ class ConsultationService:
         Returns:
             List of consultation dictionaries for the session
         """
-        self.logger.info(f"Retrieving consultations for session: {session_id}")
+        self.logger.debug("Retrieving consultations for session: %s", session_id)
         
         try:
             session_uuid = uuid.UUID(session_id) if isinstance(session_id, str) else session_id
@@ -324,7 +342,7 @@ class ConsultationService:
                 consultas = repository.find_by_session(session_uuid)
                 
                 result = [consulta.to_dict() for consulta in consultas]
-                self.logger.info(f"Retrieved {len(result)} consultations for session {session_id}")
+                self.logger.debug("Retrieved %d consultations for session %s", len(result), session_id)
                 return result
                 
         except ValueError as e:
@@ -355,6 +373,7 @@ class ConsultationService:
                 consulta = repository.update_status(id, new_status)
                 
                 if consulta:
+                    self.data_version += 1
                     self.logger.info(f"Consultation {id} status updated successfully")
                     return consulta.to_dict()
                 else:
@@ -0,0 +1,115 @@
+"""
+Group-commit writer for consultation records.
+
+Concurrent persist requests are queued and written by a single worker:
+everything that arrived while the previous batch was being written goes
+into the next transaction. Callers still await their own row, so the
+consultation ID is returned exactly as with a direct insert.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from src.core.database import get_session_factory
+from src.repositories.consulta_repository import ConsultaRepository
+
+logger = logging.getLogger(__name__)
+
+# Maximum rows written in a single transaction
+MAX_BATCH_SIZE = 64
+
+
+class ConsultationWriter:
+    """
+    Batches consultation inserts into shared transactions.
+    
+    The worker task starts on first use and stops with close().
+    """
+    
+    def __init__(self, session_factory=None, max_batch_size: int = MAX_BATCH_SIZE):
+        """
+        Initialize the writer.
+        
+        Args:
+            session_factory: SQLAlchemy session factory (defaults to the app factory)
+            max_batch_size: Maximum rows per transaction
+        """
+        self.session_factory = session_factory or get_session_factory()
+        self.max_batch_size = max_batch_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+    
+    async def submit(self, consulta_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Queue a consultation for insertion and wait until it is committed.
+        
+        Args:
+            consulta_data: Column values for the Consulta model
+            
+        Returns:
+            Dictionary representation of the persisted consultation
+            
+        Raises:
+            Exception: The database error that prevented this row from being saved
+        """
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((consulta_data, future))
+        return await future
+    
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            
+            try:
+                results = await run_in_threadpool(self._write_batch, [data for data, _ in batch])
+            except Exception as e:
+                results = [e] * len(batch)
+            
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+                self._queue.task_done()
+    
+    def _write_batch(self, rows: List[Dict[str, Any]]) -> List[Any]:
+        """Write rows in one transaction; on failure retry each row on its own."""
+        try:
+            with self.session_factory() as session:
+                consultas = ConsultaRepository(session).create_many(rows)
+                return [consulta.to_dict() for consulta in consultas]
+        except Exception as e:
+            if len(rows) == 1:
+                return [e]
+            logger.warning(f"Batch insert of {len(rows)} consultations failed, retrying individually: {e}")
+        
+        return [self._write_one(row) for row in rows]
+    
+    def _write_one(self, row: Dict[str, Any]) -> Any:
+        try:
+            with self.session_factory() as session:
+                return ConsultaRepository(session).create_many([row])[0].to_dict()
+        except Exception as e:
+            return e
+    
+    async def close(self) -> None:
+        """Flush queued rows and stop the worker task."""
+        if self._worker is not None:
+            if not self._worker.done():
+                await self._queue.join()
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
@@ -10,7 +10,7 @@ This service coordinates entity extraction including:
 
 from typing import Dict, Any, Optional, List
 import logging
-from datetime import datetime
+from src.core import clock
 from src.core.entity_extraction import EntityExtractor
 from src.core.validation.normalizers.data_normalizer import DataNormalizer
 from src.core.validation.validation_orchestrator import ValidationOrchestrator
@@ -50,7 +50,7 @@ class ExtractionService:
         Returns:
             Dictionary containing extraction results with metadata
         """
-        logger.info(f"Extracting entities from message: {message[:50]}...")
+        logger.debug("Extracting entities from message: %.50s...", message)
         
         try:
             # Preprocess message with context
@@ -87,14 +87,14 @@ class ExtractionService:
                 "validation_summary": validation_result.get("validation_summary", {}),
                 "quality_metrics": self._calculate_quality_metrics(extracted_data, validation_result),
                 "metadata": {
-                    "extraction_timestamp": datetime.utcnow().isoformat(),
+                    "extraction_timestamp": clock.utcnow_iso(),
                     "message_length": len(message),
                     "entities_found": len([v for v in extracted_data.values() if v is not None]),
                     "context_used": context is not None
                 }
             }
             
-            logger.info(f"Entity extraction completed successfully. Confidence: {final_confidence:.2f}")
+            logger.debug("Entity extraction completed successfully. Confidence: %.2f", final_confidence)
             return result
             
         except Exception as e:
@@ -258,7 +258,7 @@ class ExtractionService:
                 "validation_errors": 1
             },
             "metadata": {
-                "extraction_timestamp": datetime.utcnow().isoformat(),
+                "extraction_timestamp": clock.utcnow_iso(),
                 "error_type": "extraction_failure"
             }
         }
@@ -1,16 +1,84 @@
-from datetime import datetime
+import heapq
+import time
 import logging
+from collections import OrderedDict
+from itertools import islice
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from src.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass(slots=True)
+class SessionSummary:
+    """Resumo leve de uma sessão, mantido atualizado a cada escrita."""
+    session_id: str
+    session_start: Optional[str]
+    total_messages: int
+    extracted_fields: Tuple[str, ...]
+    average_confidence: float
+
+    @classmethod
+    def from_context(cls, session_id: str, context: dict) -> "SessionSummary":
+        return cls(
+            session_id=session_id,
+            session_start=context.get("session_start"),
+            total_messages=len(context.get("conversation_history", ())),
+            extracted_fields=tuple(context.get("extracted_data", {})),
+            average_confidence=context.get("average_confidence", 0.0)
+        )
+
+
 class SessionService:
     """
     Service responsável por gerenciar o contexto de sessão das conversas.
     Centraliza criação, recuperação, atualização e deleção de sessões.
+    
+    Cada sessão tem TTL próprio (renovado a cada escrita), como um EXPIRE
+    por chave: sessões expiradas são descartadas no acesso, sem varredura.
+    Um min-heap de expirações permite à limpeza visitar só o que expirou.
+    O número de sessões é limitado: ao exceder o máximo, as menos
+    recentemente usadas (lidas ou escritas) são descartadas (LRU).
     """
-    def __init__(self):
+    def __init__(self, ttl_seconds: float = None, max_sessions: int = None):
         # Pode ser substituído por persistência real futuramente
-        self._sessions = {}
+        self._sessions = OrderedDict()
+        self._summaries = {}
+        self._expires_at = {}
+        # Min-heap de (expiry_ts, session_id); no máximo uma entrada válida por sessão
+        self._expiry_heap = []
+        self._heap_ts = {}
+        self._ttl = ttl_seconds if ttl_seconds is not None else get_settings().SESSION_TTL
+        self._max_sessions = max_sessions if max_sessions is not None else get_settings().SESSION_MAX_COUNT
+
+    def _touch(self, session_id: str) -> None:
+        expires_at = time.time() + self._ttl
+        self._expires_at[session_id] = expires_at
+        if session_id not in self._heap_ts:
+            self._schedule(session_id, expires_at)
+
+    def _schedule(self, session_id: str, expires_at: float) -> None:
+        heapq.heappush(self._expiry_heap, (expires_at, session_id))
+        self._heap_ts[session_id] = expires_at
+
+    def _is_expired(self, session_id: str, now: float) -> bool:
+        return self._expires_at.get(session_id, 0.0) <= now
+
+    def _store(self, session_id: str, context: dict) -> None:
+        self._sessions[session_id] = context
+        self._sessions.move_to_end(session_id)
+        self._summaries[session_id] = SessionSummary.from_context(session_id, context)
+        self._touch(session_id)
+        while len(self._sessions) > self._max_sessions:
+            oldest_id = next(iter(self._sessions))
+            self._evict(oldest_id)
+            logger.info(f"Sessão descartada por limite de capacidade: {oldest_id}")
+
+    def _evict(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+        self._summaries.pop(session_id, None)
+        self._expires_at.pop(session_id, None)
 
     def create_session(self, session_id: str, initial_context: dict = None) -> dict:
         context = initial_context or {
@@ -21,40 +89,78 @@ class SessionService:
             "confidence_count": 0,
             "average_confidence": 0.0
         }
-        self._sessions[session_id] = context
+        self._store(session_id, context)
         return context
 
     def get_session(self, session_id: str) -> dict:
-        return self._sessions.get(session_id)
+        context = self._sessions.get(session_id)
+        if context is None:
+            return None
+        if self._is_expired(session_id, time.time()):
+            self._evict(session_id)
+            logger.info(f"Sessão expirada removida: {session_id}")
+            return None
+        # Reads count as use: an active conversation is never the LRU victim
+        self._sessions.move_to_end(session_id)
+        return context
 
     def update_session(self, session_id: str, context: dict) -> None:
-        self._sessions[session_id] = context
+        self._store(session_id, context)
 
     def delete_session(self, session_id: str) -> None:
-        if session_id in self._sessions:
-            del self._sessions[session_id]
+        self._evict(session_id)
 
     def list_sessions(self) -> dict:
-        return self._sessions.copy() 
+        now = time.time()
+        return {
+            session_id: context
+            for session_id, context in self._sessions.items()
+            if not self._is_expired(session_id, now)
+        }
     
-    def cleanup_old_sessions(self):
-        """Remove sessions older than 24 hours"""
-        current_time = datetime.utcnow()
-        sessions_to_remove = []
+    def list_summaries(self, offset: int = 0, limit: Optional[int] = None) -> List[SessionSummary]:
+        """Return precomputed summaries of active sessions (no context walk)"""
+        now = time.time()
+        active = (
+            summary for session_id, summary in self._summaries.items()
+            if not self._is_expired(session_id, now)
+        )
+        # Stops iterating once the page is full instead of filtering every session
+        stop = None if limit is None else offset + limit
+        return list(islice(active, offset, stop))
+    
+    def page_summaries(self, offset: int = 0, limit: Optional[int] = None) -> Tuple[List[SessionSummary], int]:
+        """
+        Return one page of active session summaries and the exact active total.
         
-        for session_id, context in self._sessions.items():
-            session_start = context.get("session_start")
-            if session_start:
-                try:
-                    start_time = datetime.fromisoformat(session_start)
-                    if (current_time - start_time).total_seconds() > 86400:  # 24 hours
-                        sessions_to_remove.append(session_id)
-                except (ValueError, TypeError):
-                    # Invalid timestamp, remove session
-                    sessions_to_remove.append(session_id)
+        Expired sessions are evicted first (only due heap entries are visited),
+        so every stored session is active and the total matches the pages.
+        """
+        self.cleanup_old_sessions()
+        stop = None if limit is None else offset + limit
+        return list(islice(self._summaries.values(), offset, stop)), len(self._sessions)
+    
+    def cleanup_old_sessions(self):
+        """Remove sessions whose TTL has elapsed, visiting only due heap entries"""
+        now = time.time()
+        heap = self._expiry_heap
+        removed = 0
         
-        for session_id in sessions_to_remove:
-            del self._sessions[session_id]
-            logger.info(f"Sessão expirada removida: {session_id}")
+        while heap and heap[0][0] <= now:
+            scheduled_at, session_id = heapq.heappop(heap)
+            if self._heap_ts.get(session_id) != scheduled_at:
+                # Stale entry left behind by a deleted/recreated session
+                continue
+            del self._heap_ts[session_id]
+            
+            if session_id not in self._sessions:
+                continue
+            if self._is_expired(session_id, now):
+                self._evict(session_id)
+                removed += 1
+                logger.info(f"Sessão expirada removida: {session_id}")
+            else:
+                # TTL was renewed since scheduling; reschedule at the new expiry
+                self._schedule(session_id, self._expires_at[session_id])
             
-        return len(sessions_to_remove)
\ No newline at end of file
+        return removed
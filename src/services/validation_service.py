@@ -11,6 +11,7 @@ This service coordinates data validation including:
 from typing import Dict, Any, Optional, List
 import logging
 from datetime import datetime
+from src.core import clock
 from src.core.validation.validation_orchestrator import ValidationOrchestrator
 from src.core.validation.normalizers.data_normalizer import DataNormalizer
 from src.core.validation.validators.base_validator import BaseValidator
@@ -54,7 +55,7 @@ class ValidationService:
         Returns:
             Dictionary containing validation results and recommendations
         """
-        logger.info(f"Validating consultation data with {len(data)} fields")
+        logger.debug("Validating consultation data with %d fields", len(data))
         
         try:
             # Step 1: Normalize data first
@@ -84,7 +85,7 @@ class ValidationService:
                 "errors": validation_result.get("errors", []),
                 "warnings": validation_result.get("warnings", []),
                 "metadata": {
-                    "validation_timestamp": datetime.utcnow().isoformat(),
+                    "validation_timestamp": clock.utcnow_iso(),
                     "fields_validated": len(normalized_data),
                     "validation_rules_applied": len(validation_result.get("field_validations", {}))
                 }
@@ -106,7 +107,7 @@ class ValidationService:
         Returns:
             Dictionary containing field validation result
         """
-        logger.info(f"Validating field '{field_name}' with value '{field_value}'")
+        logger.debug("Validating field '%s' with value '%s'", field_name, field_value)
         
         try:
             # Auto-detect field type if not specified
@@ -344,7 +345,7 @@ class ValidationService:
             "errors": [error_message],
             "warnings": [],
             "metadata": {
-                "validation_timestamp": datetime.utcnow().isoformat(),
+                "validation_timestamp": clock.utcnow_iso(),
                 "error_type": "validation_failure"
             }
         }
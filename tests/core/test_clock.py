@@ -0,0 +1,38 @@
+import asyncio
+import pytest
+from datetime import datetime
+from src.core import clock
+
+
+class TestClock:
+    """Testes para o relógio compartilhado de baixa resolução."""
+
+    def test_falls_back_to_real_clock_without_ticker(self):
+        """Testa que sem o ticker os helpers retornam o horário atual."""
+        before = datetime.utcnow()
+        now = clock.utcnow()
+
+        assert now >= before
+        assert datetime.fromisoformat(clock.utcnow_iso()) >= before
+
+    @pytest.mark.asyncio
+    async def test_ticker_serves_cached_value(self):
+        """Testa que com o ticker ativo o mesmo objeto é reutilizado."""
+        clock.start_clock()
+        try:
+            first = clock.utcnow()
+            second = clock.utcnow()
+
+            assert first is second
+            assert clock.utcnow_iso() == first.isoformat()
+            assert clock.isoformat(first) is clock.utcnow_iso()
+        finally:
+            await clock.stop_clock()
+
+        assert clock._ticker is None
+
+    def test_isoformat_formats_other_datetimes(self):
+        """Testa que datetimes fora do tick atual são formatados normalmente."""
+        value = datetime(2025, 7, 22, 15, 30)
+
+        assert clock.isoformat(value) == "2025-07-22T15:30:00"
@@ -0,0 +1,54 @@
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+from src.core.entity_extraction import EntityExtractor
+
+
+class TestEntityExtractorFastPath:
+    """Testes para o fast path de extração sem LLM."""
+
+    def setup_method(self):
+        """Setup para cada teste."""
+        self.openai_client = MagicMock()
+        self.openai_client.extract_entities = AsyncMock(return_value={"success": False, "error": "LLM"})
+        self.extractor = EntityExtractor(openai_client=self.openai_client)
+
+    def test_fast_extract_labeled_message(self):
+        """Testa extração de mensagem com todos os campos obrigatórios rotulados."""
+        result = self.extractor._fast_extract(
+            "Nome: João Silva, telefone: (11) 99999-8888, data: 15/08/2025, horário: 14h30"
+        )
+
+        assert result == {
+            "nome": "João Silva",
+            "telefone": "(11) 99999-8888",
+            "data": "15/08/2025",
+            "horario": "14h30",
+            "tipo_consulta": None
+        }
+
+    def test_fast_extract_requires_all_fields(self):
+        """Testa que mensagens incompletas ou livres não usam o fast path."""
+        assert self.extractor._fast_extract("Quero marcar consulta amanhã de manhã") is None
+        assert self.extractor._fast_extract("Nome: João Silva, telefone: 11999998888") is None
+        assert self.extractor._fast_extract(
+            "Nome: João Silva, telefone: 11999998888, data: amanhã, horário: 14h"
+        ) is None
+
+    @pytest.mark.asyncio
+    async def test_labeled_message_skips_llm(self):
+        """Testa que mensagem rotulada não chama a API OpenAI."""
+        result = await self.extractor.extract_consulta_entities(
+            "Nome: João Silva, telefone: 11999998888, data: 15/08/2025, horário: 14:30"
+        )
+
+        assert result["success"] is True
+        assert result["fast_path"] is True
+        assert result["extracted_data"]["name"] == "João Silva"
+        self.openai_client.extract_entities.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_free_text_uses_llm(self):
+        """Testa que mensagem livre segue para o LLM."""
+        await self.extractor.extract_consulta_entities("Quero marcar para a Maria amanhã")
+
+        self.openai_client.extract_entities.assert_awaited_once()
@@ -0,0 +1,31 @@
+import uuid
+from unittest.mock import patch
+from src.core import id_pool
+from src.core.id_pool import new_id
+
+
+class TestIdPool:
+    """Testes para o pool de identificadores."""
+
+    def test_new_id_format(self):
+        """Testa que o id gerado é hex de 32 caracteres compatível com UUID."""
+        value = new_id()
+
+        assert len(value) == 32
+        assert uuid.UUID(value).hex == value
+
+    def test_new_id_unique(self):
+        """Testa unicidade dos ids através de mais de um lote."""
+        ids = {new_id() for _ in range(id_pool.ID_BATCH_SIZE * 2 + 1)}
+
+        assert len(ids) == id_pool.ID_BATCH_SIZE * 2 + 1
+
+    def test_refill_uses_single_entropy_read(self):
+        """Testa que o pool é reabastecido com uma única leitura de entropia."""
+        id_pool._id_pool.clear()
+
+        with patch("src.core.id_pool.secrets.token_bytes", wraps=id_pool.secrets.token_bytes) as mock_token:
+            for _ in range(id_pool.ID_BATCH_SIZE):
+                new_id()
+
+        mock_token.assert_called_once_with(id_pool.ID_BYTES * id_pool.ID_BATCH_SIZE)
@@ -1,8 +1,10 @@
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
+import asyncio
 import json
-import requests
-from src.core.openai_client import OpenAIClient
+import httpx
+import orjson
+from src.core.openai_client import OpenAIClient, close_http_client, get_completion_cache
 
 
 class TestOpenAIClient:
@@ -10,7 +12,10 @@ class TestOpenAIClient:
 
     def setup_method(self):
         """Setup para cada teste."""
-        self.client = OpenAIClient()
+        self.http_client = MagicMock()
+        self.http_client.post = AsyncMock()
+        self.client = OpenAIClient(http_client=self.http_client)
+        get_completion_cache().clear()
 
     @patch('src.core.openai_client.get_settings')
     def test_client_initialization(self, mock_settings):
@@ -31,13 +36,24 @@ class TestOpenAIClient:
         assert client.timeout == 30
         assert client.api_url == "https://api.openai.com/v1/chat/completions"
 
-    @patch('src.core.openai_client.requests.post')
     @pytest.mark.asyncio
-    async def test_chat_completion_success(self, mock_post):
+    async def test_clients_share_http_client(self):
+        """Testa que clientes sem injeção reutilizam o mesmo AsyncClient."""
+        first = OpenAIClient()
+        second = OpenAIClient()
+
+        try:
+            assert first.http_client is second.http_client
+        finally:
+            await close_http_client()
+
+    @pytest.mark.asyncio
+    async def test_chat_completion_success(self):
         """Testa chat completion com sucesso."""
+        mock_post = self.http_client.post
         mock_response = MagicMock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "choices": [
                 {
                     "message": {
@@ -45,7 +61,7 @@ class TestOpenAIClient:
                     }
                 }
             ]
-        }
+        })
         mock_post.return_value = mock_response
 
         result = await self.client.chat_completion("Olá")
@@ -53,15 +69,15 @@ class TestOpenAIClient:
         assert result == "Olá! Como posso ajudar?"
         mock_post.assert_called_once()
 
-    @patch('src.core.openai_client.requests.post')
     @pytest.mark.asyncio
-    async def test_chat_completion_with_custom_prompt(self, mock_post):
+    async def test_chat_completion_with_custom_prompt(self):
         """Testa chat completion com prompt customizado."""
+        mock_post = self.http_client.post
         mock_response = MagicMock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "choices": [{"message": {"content": "Resposta customizada"}}]
-        }
+        })
         mock_post.return_value = mock_response
 
         custom_prompt = "Você é um assistente médico."
@@ -70,53 +86,107 @@ class TestOpenAIClient:
         assert result == "Resposta customizada"
         
         call_args = mock_post.call_args
-        data = call_args[1]["json"]
+        data = orjson.loads(call_args[1]["content"])
         assert data["messages"][0]["content"] == custom_prompt
 
-    @patch('src.core.openai_client.requests.post')
     @pytest.mark.asyncio
-    async def test_chat_completion_request_exception(self, mock_post):
+    async def test_chat_completion_request_exception(self):
         """Testa tratamento de erro de request."""
-        mock_post.side_effect = requests.exceptions.ConnectionError("Erro de conexão")
+        mock_post = self.http_client.post
+        mock_post.side_effect = httpx.ConnectError("Erro de conexão")
 
         result = await self.client.chat_completion("Olá")
 
         assert "Erro de conexão com a API OpenAI" in result
         assert "Erro de conexão" in result
 
-    @patch('src.core.openai_client.requests.post')
     @pytest.mark.asyncio
-    async def test_chat_completion_json_decode_error(self, mock_post):
+    async def test_chat_completion_json_decode_error(self):
         """Testa tratamento de erro de JSON."""
+        mock_post = self.http_client.post
         mock_response = MagicMock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
+        mock_response.content = b"Invalid JSON"
         mock_post.return_value = mock_response
 
         result = await self.client.chat_completion("Olá")
 
         assert "Erro ao processar resposta da API" in result
 
-    @patch('src.core.openai_client.requests.post')
     @pytest.mark.asyncio
-    async def test_chat_completion_key_error(self, mock_post):
+    async def test_chat_completion_key_error(self):
         """Testa tratamento de erro de estrutura de resposta."""
+        mock_post = self.http_client.post
         mock_response = MagicMock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {"invalid": "structure"}
+        mock_response.content = orjson.dumps({"invalid": "structure"})
         mock_post.return_value = mock_response
 
         result = await self.client.chat_completion("Olá")
 
         assert "Resposta inesperada da API" in result
 
+    @pytest.mark.asyncio
+    async def test_chat_completion_uses_cache(self):
+        """Testa que mensagens idênticas são servidas do cache."""
+        mock_post = self.http_client.post
+        mock_response = MagicMock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = orjson.dumps({
+            "choices": [{"message": {"content": "Resposta em cache"}}]
+        })
+        mock_post.return_value = mock_response
+
+        first = await self.client.chat_completion("Mensagem repetida")
+        second = await self.client.chat_completion("Mensagem repetida")
+
+        assert first == second == "Resposta em cache"
+        mock_post.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_chat_completion_errors_not_cached(self):
+        """Testa que erros de conexão não são armazenados no cache."""
+        mock_post = self.http_client.post
+        mock_post.side_effect = httpx.ConnectError("Erro de conexão")
+
+        await self.client.chat_completion("Mensagem com erro")
+        await self.client.chat_completion("Mensagem com erro")
+
+        assert mock_post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_requests_respect_concurrency_limit(self):
+        """Testa que o semáforo limita chamadas simultâneas à API."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_post(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            response = MagicMock()
+            response.content = orjson.dumps({"choices": [{"message": {"content": "ok"}}]})
+            return response
+
+        self.http_client.post.side_effect = slow_post
+
+        with patch("src.core.openai_client._request_semaphore", asyncio.Semaphore(2)):
+            await asyncio.gather(*(self.client.chat_completion(f"Mensagem {i}") for i in range(6)))
+
+        assert self.http_client.post.call_count == 6
+        assert peak == 2
+
 
 class TestOpenAIClientEntityExtraction:
     """Testes para extração de entidades."""
 
     def setup_method(self):
         """Setup para cada teste."""
-        self.client = OpenAIClient()
+        self.http_client = MagicMock()
+        self.http_client.post = AsyncMock()
+        self.client = OpenAIClient(http_client=self.http_client)
         self.function_schema = {
             "name": "extract_consultation",
             "parameters": {
@@ -129,13 +199,13 @@ class TestOpenAIClientEntityExtraction:
             }
         }
 
-    @patch('src.core.openai_client.requests.post')
     @pytest.mark.asyncio
-    async def test_extract_entities_success(self, mock_post):
+    async def test_extract_entities_success(self):
         """Testa extração de entidades com sucesso."""
+        mock_post = self.http_client.post
         mock_response = MagicMock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "choices": [{
                 "message": {
                     "function_call": {
@@ -148,7 +218,7 @@ class TestOpenAIClientEntityExtraction:
                     }
                 }
             }]
-        }
+        })
         mock_post.return_value = mock_response
 
         result = await self.client.extract_entities(
@@ -161,13 +231,13 @@ class TestOpenAIClientEntityExtraction:
         assert result["confidence_score"] == 1.0  # Todos os campos preenchidos
         assert len(result["missing_fields"]) == 0
 
-    @patch('src.core.openai_client.requests.post')
     @pytest.mark.asyncio
-    async def test_extract_entities_partial_data(self, mock_post):
+    async def test_extract_entities_partial_data(self):
         """Testa extração com dados parciais."""
+        mock_post = self.http_client.post
         mock_response = MagicMock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "choices": [{
                 "message": {
                     "function_call": {
@@ -180,7 +250,7 @@ class TestOpenAIClientEntityExtraction:
                     }
                 }
             }]
-        }
+        })
         mock_post.return_value = mock_response
 
         result = await self.client.extract_entities(
@@ -194,19 +264,19 @@ class TestOpenAIClientEntityExtraction:
         assert "telefone" in result["missing_fields"]
         assert "horario" in result["missing_fields"]
 
-    @patch('src.core.openai_client.requests.post')
     @pytest.mark.asyncio
-    async def test_extract_entities_no_function_call(self, mock_post):
+    async def test_extract_entities_no_function_call(self):
         """Testa quando o modelo não retorna function call."""
+        mock_post = self.http_client.post
         mock_response = MagicMock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "choices": [{
                 "message": {
                     "content": "Desculpe, não consegui entender."
                 }
             }]
-        }
+        })
         mock_post.return_value = mock_response
 
         result = await self.client.extract_entities(
@@ -217,11 +287,11 @@ class TestOpenAIClientEntityExtraction:
         assert result["success"] is False
         assert "não conseguiu extrair dados estruturados" in result["error"]
 
-    @patch('src.core.openai_client.requests.post')
     @pytest.mark.asyncio
-    async def test_extract_entities_request_error(self, mock_post):
+    async def test_extract_entities_request_error(self):
         """Testa tratamento de erro de request na extração."""
-        mock_post.side_effect = requests.exceptions.Timeout("Timeout")
+        mock_post = self.http_client.post
+        mock_post.side_effect = httpx.ReadTimeout("Timeout")
 
         result = await self.client.extract_entities(
             "João Silva",
@@ -237,15 +307,17 @@ class TestOpenAIClientFullLLM:
 
     def setup_method(self):
         """Setup para cada teste."""
-        self.client = OpenAIClient()
+        self.http_client = MagicMock()
+        self.http_client.post = AsyncMock()
+        self.client = OpenAIClient(http_client=self.http_client)
 
-    @patch('src.core.openai_client.requests.post')
     @pytest.mark.asyncio
-    async def test_full_llm_completion_success(self, mock_post):
+    async def test_full_llm_completion_success(self):
         """Testa full LLM completion com JSON válido."""
+        mock_post = self.http_client.post
         mock_response = MagicMock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "choices": [{
                 "message": {
                     "content": json.dumps({
@@ -265,7 +337,7 @@ class TestOpenAIClientFullLLM:
                     }, ensure_ascii=False)
                 }
             }]
-        }
+        })
         mock_post.return_value = mock_response
 
         result = await self.client.full_llm_completion("Olá")
@@ -275,13 +347,13 @@ class TestOpenAIClientFullLLM:
         assert result_data["action"] == "extract"
         assert result_data["confidence"] == 0.8
 
-    @patch('src.core.openai_client.requests.post')
     @pytest.mark.asyncio
-    async def test_full_llm_completion_with_context(self, mock_post):
+    async def test_full_llm_completion_with_context(self):
         """Testa full LLM completion com contexto."""
+        mock_post = self.http_client.post
         mock_response = MagicMock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "choices": [{
                 "message": {
                     "content": json.dumps({
@@ -295,7 +367,7 @@ class TestOpenAIClientFullLLM:
                     })
                 }
             }]
-        }
+        })
         mock_post.return_value = mock_response
 
         context = {
@@ -311,19 +383,19 @@ class TestOpenAIClientFullLLM:
         assert result_data["response"] == "Perfeito, João!"
         assert result_data["confidence"] == 0.9
 
-    @patch('src.core.openai_client.requests.post')
     @pytest.mark.asyncio
-    async def test_full_llm_completion_invalid_json_fallback(self, mock_post):
+    async def test_full_llm_completion_invalid_json_fallback(self):
         """Testa fallback quando LLM retorna JSON inválido."""
+        mock_post = self.http_client.post
         mock_response = MagicMock()
         mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "choices": [{
                 "message": {
                     "content": "Resposta não JSON do modelo"
                 }
             }]
-        }
+        })
         mock_post.return_value = mock_response
 
         result = await self.client.full_llm_completion("Olá")
@@ -333,11 +405,11 @@ class TestOpenAIClientFullLLM:
         assert result_data["action"] == "extract"
         assert result_data["confidence"] == 0.5
 
-    @patch('src.core.openai_client.requests.post')
     @pytest.mark.asyncio
-    async def test_full_llm_completion_connection_error(self, mock_post):
+    async def test_full_llm_completion_connection_error(self):
         """Testa tratamento de erro de conexão."""
-        mock_post.side_effect = requests.exceptions.ConnectionError("Sem conexão")
+        mock_post = self.http_client.post
+        mock_post.side_effect = httpx.ConnectError("Sem conexão")
 
         result = await self.client.full_llm_completion("Olá")
         result_data = json.loads(result)
@@ -347,10 +419,10 @@ class TestOpenAIClientFullLLM:
         assert result_data["confidence"] == 0.0
         assert len(result_data["validation_errors"]) > 0
 
-    @patch('src.core.openai_client.requests.post')
     @pytest.mark.asyncio
-    async def test_full_llm_completion_general_error(self, mock_post):
+    async def test_full_llm_completion_general_error(self):
         """Testa tratamento de erro geral."""
+        mock_post = self.http_client.post
         mock_post.side_effect = Exception("Erro inesperado")
 
         result = await self.client.full_llm_completion("Olá")
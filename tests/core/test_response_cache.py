@@ -0,0 +1,129 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+from src.core.cache import ResponseCache
+
+
+class TestResponseCache:
+    """Testes para o cache de respostas."""
+
+    def test_make_key_is_deterministic(self):
+        """Testa que a mesma entrada gera a mesma chave."""
+        assert ResponseCache.make_key("gpt", "Olá") == ResponseCache.make_key("gpt", "Olá")
+        assert ResponseCache.make_key("gpt", "Olá") != ResponseCache.make_key("gpt-4", "Olá")
+        assert ResponseCache.make_key("ab", "c") != ResponseCache.make_key("a", "bc")
+
+    def test_lru_eviction(self):
+        """Testa remoção da entrada menos usada quando o cache enche."""
+        cache = ResponseCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_ttl_expiration(self):
+        """Testa expiração de entradas após o TTL."""
+        cache = ResponseCache(ttl_seconds=10)
+        with patch("src.core.cache.response_cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("src.core.cache.response_cache.time.monotonic", return_value=111.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_get_or_compute_caches_result(self):
+        """Testa que o cálculo só é executado uma vez por chave."""
+        cache = ResponseCache()
+        compute = AsyncMock(return_value={"success": True})
+
+        first = await cache.get_or_compute("k", compute)
+        second = await cache.get_or_compute("k", compute)
+
+        assert first == second == {"success": True}
+        compute.assert_awaited_once()
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_get_or_compute_respects_should_store(self):
+        """Testa que resultados rejeitados pelo predicado não são armazenados."""
+        cache = ResponseCache()
+        compute = AsyncMock(return_value={"success": False})
+
+        await cache.get_or_compute("k", compute, should_store=lambda r: r["success"])
+        await cache.get_or_compute("k", compute, should_store=lambda r: r["success"])
+
+        assert compute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_or_compute_coalesces_concurrent_misses(self):
+        """Testa que chamadas simultâneas com a mesma chave compartilham um único cálculo."""
+        cache = ResponseCache()
+        release = asyncio.Event()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"success": False}
+
+        tasks = [asyncio.create_task(cache.get_or_compute("k", compute, should_store=lambda r: r["success"])) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert calls == 1
+        assert cache.coalesced == 4
+        assert all(r == {"success": False} for r in results)
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_get_or_compute_propagates_error_to_coalesced_callers(self):
+        """Testa que erros do cálculo chegam a todos os chamadores e não ficam em voo."""
+        cache = ResponseCache()
+        release = asyncio.Event()
+
+        async def compute():
+            await release.wait()
+            raise RuntimeError("upstream down")
+
+        tasks = [asyncio.create_task(cache.get_or_compute("k", compute)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert cache._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_get_or_compute_leader_cancellation_does_not_fail_followers(self):
+        """Testa que cancelar o primeiro chamador não cancela o cálculo dos demais."""
+        cache = ResponseCache()
+        release = asyncio.Event()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"success": True}
+
+        leader = asyncio.create_task(cache.get_or_compute("k", compute))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(cache.get_or_compute("k", compute)) for _ in range(2)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*followers)
+
+        assert leader.cancelled()
+        assert calls == 1
+        assert all(r == {"success": True} for r in results)
+        assert cache.get("k") == {"success": True}
+        assert cache._inflight == {}
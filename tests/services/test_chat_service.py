@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 import json
@@ -60,6 +61,17 @@ class TestChatService:
         assert context["extracted_data"]["nome"] == "João"
         self.mock_session_service.create_session.assert_not_called()
 
+    def test_get_or_create_session_context_generates_unique_ids(self):
+        """Testa que sessões sem ID recebem identificadores distintos no mesmo segundo."""
+        self.mock_session_service.get_session.return_value = None
+        self.mock_session_service.create_session.side_effect = lambda session_id, context: context
+
+        first = self.chat_service._get_or_create_session_context(None)
+        second = self.chat_service._get_or_create_session_context(None)
+
+        assert first["session_id"] != second["session_id"]
+        assert len(first["session_id"]) == 32
+
     @patch('src.services.chat_service.get_openai_client')
     @patch.object(ChatService, '_get_or_create_session_context')
     @pytest.mark.asyncio
@@ -101,7 +113,7 @@ class TestChatService:
         assert "Qual é o seu telefone?" in result["next_questions"]
         self.mock_session_service.update_session.assert_called_once()
 
-    @patch('src.services.chat_service.ReasoningCoordinator')
+    @patch('src.services.chat_service.get_reasoning_coordinator')
     @patch.object(ChatService, '_get_or_create_session_context')
     @patch.object(ChatService, '_handle_persistence')
     @pytest.mark.asyncio
@@ -165,7 +177,7 @@ class TestChatService:
         self.chat_service.settings = MagicMock(USE_FULL_LLM_VALIDATION=False)
 
         # Simulate reasoning engine failure
-        with patch('src.services.chat_service.ReasoningCoordinator') as mock_reasoning:
+        with patch('src.services.chat_service.get_reasoning_coordinator') as mock_reasoning:
             mock_reasoning.return_value = None
 
             # Execute
@@ -350,7 +362,8 @@ class TestChatServiceErrorHandling:
         result = await self.chat_service.process_message("Teste")
 
         assert "Ocorreu um erro ao processar sua mensagem" in result["response"]
-        assert "Erro inesperado" in result["response"]
+        # Exception details are logged, not returned to the client
+        assert "Erro inesperado" not in result["response"]
         assert result["action"] == "error"
 
     @patch('src.services.chat_service.get_openai_client')
@@ -376,6 +389,48 @@ class TestChatServiceErrorHandling:
         assert "AI service unavailable" in result["response"]
         assert result["action"] == "error"
 
+    @patch.object(ChatService, '_process_with_reasoning_engine')
+    @patch.object(ChatService, '_get_or_create_session_context')
+    @pytest.mark.asyncio
+    async def test_process_message_error_keeps_session_id(self, mock_get_context, mock_process):
+        """Testa que a resposta de erro mantém o ID da sessão já resolvida."""
+        mock_get_context.return_value = {"session_id": "generated_session"}
+        mock_process.side_effect = RuntimeError("falha inesperada")
+
+        self.chat_service.settings = MagicMock(USE_FULL_LLM_VALIDATION=False)
+
+        result = await self.chat_service.process_message("Teste")
+
+        assert result["action"] == "error"
+        assert result["session_id"] == "generated_session"
+        assert result["response"] == "Ocorreu um erro ao processar sua mensagem."
+        assert "falha inesperada" not in result["response"]
+
+    @patch('src.services.chat_service.get_openai_client')
+    @patch.object(ChatService, '_get_or_create_session_context')
+    @pytest.mark.asyncio
+    async def test_process_message_full_llm_invalid_json(self, mock_get_context, mock_get_openai):
+        """Testa resposta do LLM que não é JSON válido no modo full LLM."""
+        mock_get_context.return_value = {
+            "session_id": "test_session",
+            "extracted_data": {},
+            "conversation_history": [],
+            "total_confidence": 0.0,
+            "confidence_count": 0,
+            "average_confidence": 0.0
+        }
+        mock_openai_client = AsyncMock()
+        mock_openai_client.full_llm_completion.return_value = "não é JSON"
+        mock_get_openai.return_value = mock_openai_client
+
+        self.chat_service.settings = MagicMock(USE_FULL_LLM_VALIDATION=True)
+
+        result = await self.chat_service.process_message("Teste")
+
+        assert "Error processing AI response" in result["response"]
+        assert result["action"] == "error"
+        assert result["session_id"] == "test_session"
+
     @patch('src.services.chat_service.get_consultation_service')
     @pytest.mark.asyncio
     async def test_handle_persistence_service_unavailable(self, mock_get_consultation):
@@ -408,4 +463,138 @@ class TestChatServiceErrorHandling:
         )
 
         assert consultation_id is None
-        assert status == "error"
\ No newline at end of file
+        assert status == "error"
+
+
+    @patch('src.services.chat_service.get_reasoning_coordinator')
+    @patch.object(ChatService, '_get_or_create_session_context')
+    @patch.object(ChatService, '_handle_persistence')
+    @pytest.mark.asyncio
+    async def test_process_message_reasoning_timeout(self, mock_handle_persistence, mock_get_context, mock_reasoning_coordinator):
+        """Testa que o timeout da etapa de LLM propaga sem iniciar a persistência."""
+        context = {"session_id": "slow_session", "extracted_data": {}, "conversation_history": []}
+        mock_get_context.return_value = context
+
+        async def slow_reasoning(message, ctx):
+            await asyncio.sleep(1)
+
+        mock_reasoning_coordinator.return_value = MagicMock(process_message=slow_reasoning)
+        self.chat_service.settings = MagicMock(USE_FULL_LLM_VALIDATION=False)
+        self.chat_service.llm_timeout = 0.01
+
+        with pytest.raises(TimeoutError):
+            await self.chat_service.process_message("Teste", "slow_session")
+
+        mock_handle_persistence.assert_not_called()
+        self.mock_session_service.update_session.assert_called_once_with("slow_session", context)
+
+    @patch('src.services.chat_service.get_reasoning_coordinator')
+    @patch.object(ChatService, '_get_or_create_session_context')
+    @patch.object(ChatService, '_handle_persistence')
+    @pytest.mark.asyncio
+    async def test_process_message_persistence_outside_timeout(self, mock_handle_persistence, mock_get_context, mock_reasoning_coordinator):
+        """Testa que a persistência não é interrompida pelo timeout da etapa de LLM."""
+        mock_get_context.return_value = {"session_id": "test_session", "extracted_data": {}, "conversation_history": []}
+
+        mock_reasoning_instance = AsyncMock()
+        mock_reasoning_instance.process_message.return_value = {
+            "response": "Dados processados",
+            "action": "extract",
+            "extracted_data": {"nome": "João Silva"},
+            "confidence": 0.9,
+            "next_questions": []
+        }
+        mock_reasoning_coordinator.return_value = mock_reasoning_instance
+
+        async def slow_persistence(*args):
+            await asyncio.sleep(0.05)
+            return 321, "success"
+
+        mock_handle_persistence.side_effect = slow_persistence
+        self.chat_service.settings = MagicMock(USE_FULL_LLM_VALIDATION=False)
+        self.chat_service.llm_timeout = 0.01
+
+        result = await self.chat_service.process_message("João Silva")
+
+        assert result["consultation_id"] == 321
+        assert result["persistence_status"] == "success"
+        self.mock_session_service.update_session.assert_called_once()
+
+class TestChatServiceAsyncPersistence:
+    """Testes para persistência em segundo plano no ChatService."""
+
+    def setup_method(self):
+        """Setup para cada teste."""
+        self.mock_session_service = MagicMock(spec=SessionService)
+        self.chat_service = ChatService(session_service=self.mock_session_service)
+        self.chat_service.settings = MagicMock(USE_FULL_LLM_VALIDATION=False)
+        self.chat_service.async_persistence = True
+        self.mock_session_service.get_session.return_value = {
+            "session_id": "async_session",
+            "extracted_data": {},
+            "conversation_history": [],
+            "total_confidence": 0.0,
+            "confidence_count": 0,
+            "average_confidence": 0.0
+        }
+
+    def _mock_reasoning(self, mock_reasoning_coordinator):
+        """Configura o coordenador para retornar uma extração persistível."""
+        mock_reasoning_instance = AsyncMock()
+        mock_reasoning_instance.process_message.return_value = {
+            "response": "Dados processados",
+            "action": "extract",
+            "extracted_data": {"nome": "João Silva"},
+            "confidence": 0.9,
+            "next_questions": []
+        }
+        mock_reasoning_coordinator.return_value = mock_reasoning_instance
+
+    @patch('src.services.chat_service.get_reasoning_coordinator')
+    @patch('src.services.chat_service.get_consultation_service')
+    @pytest.mark.asyncio
+    async def test_process_message_async_persistence(self, mock_get_consultation, mock_reasoning_coordinator):
+        """Testa persistência em segundo plano com status consultado depois."""
+        self._mock_reasoning(mock_reasoning_coordinator)
+
+        mock_consultation_service = AsyncMock()
+        mock_consultation_service.process_and_persist.return_value = {"success": True, "consultation_id": 789}
+        mock_get_consultation.return_value = mock_consultation_service
+
+        result = await self.chat_service.process_message("João Silva", "async_session")
+
+        assert result["persistence_status"] == "pending"
+        assert result["consultation_id"] is None
+        assert result["response"] == "Dados processados"
+
+        status = await self.chat_service.get_persistence_status("async_session")
+
+        assert status == {"persistence_status": "success", "consultation_id": 789}
+        assert "async_session" not in self.chat_service._persistence_tasks
+
+    @pytest.mark.asyncio
+    async def test_get_persistence_status_unknown_session(self):
+        """Testa status de persistência para sessão inexistente."""
+        self.mock_session_service.get_session.return_value = None
+
+        assert await self.chat_service.get_persistence_status("missing") is None
+
+    @patch('src.services.chat_service.get_reasoning_coordinator')
+    @patch('src.services.chat_service.get_consultation_service')
+    @pytest.mark.asyncio
+    async def test_process_message_async_persistence_failure(self, mock_get_consultation, mock_reasoning_coordinator):
+        """Testa falha na persistência em segundo plano refletida no status."""
+        self._mock_reasoning(mock_reasoning_coordinator)
+
+        mock_consultation_service = AsyncMock()
+        mock_consultation_service.process_and_persist.side_effect = Exception("Erro de DB")
+        mock_get_consultation.return_value = mock_consultation_service
+
+        result = await self.chat_service.process_message("João Silva", "async_session")
+
+        assert result["persistence_status"] == "pending"
+
+        status = await self.chat_service.get_persistence_status("async_session")
+
+        assert status == {"persistence_status": "error", "consultation_id": None}
+        assert "async_session" not in self.chat_service._persistence_tasks
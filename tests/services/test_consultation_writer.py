@@ -0,0 +1,57 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock, patch
+from src.services.consultation_writer import ConsultationWriter
+
+
+def _consulta(row_id, data):
+    consulta = MagicMock()
+    consulta.to_dict.return_value = {"id": row_id, **data}
+    return consulta
+
+
+class TestConsultationWriter:
+    """Testes para o writer de consultas com group commit."""
+
+    def setup_method(self):
+        """Setup para cada teste."""
+        self.session_factory = MagicMock()
+        self.writer = ConsultationWriter(session_factory=self.session_factory)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_submits_share_transaction(self):
+        """Testa que inserts simultâneos são gravados em uma única transação."""
+        with patch("src.services.consultation_writer.ConsultaRepository") as mock_repo:
+            mock_repo.return_value.create_many.side_effect = lambda rows: [
+                _consulta(i + 1, row) for i, row in enumerate(rows)
+            ]
+
+            results = await asyncio.gather(*(
+                self.writer.submit({"nome": f"Paciente {i}"}) for i in range(3)
+            ))
+            await self.writer.close()
+
+        assert [r["id"] for r in results] == [1, 2, 3]
+        assert [r["nome"] for r in results] == ["Paciente 0", "Paciente 1", "Paciente 2"]
+        mock_repo.return_value.create_many.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_retries_rows_individually(self):
+        """Testa que uma falha no lote só afeta a linha inválida."""
+        def create_many(rows):
+            if len(rows) > 1 or not rows[0]["nome"]:
+                raise ValueError("nome obrigatório")
+            return [_consulta(7, rows[0])]
+
+        with patch("src.services.consultation_writer.ConsultaRepository") as mock_repo:
+            mock_repo.return_value.create_many.side_effect = create_many
+
+            results = await asyncio.gather(
+                self.writer.submit({"nome": "Maria"}),
+                self.writer.submit({"nome": ""}),
+                return_exceptions=True
+            )
+            await self.writer.close()
+
+        assert results[0]["id"] == 7
+        assert isinstance(results[1], ValueError)
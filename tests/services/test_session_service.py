@@ -0,0 +1,135 @@
+from unittest.mock import patch
+from src.services.session_service import SessionService
+
+
+class TestSessionService:
+    """Testes para o serviço de sessões."""
+
+    def setup_method(self):
+        """Setup para cada teste."""
+        self.session_service = SessionService(ttl_seconds=100)
+
+    def test_create_and_get_session(self):
+        """Testa criação e recuperação de sessão."""
+        context = self.session_service.create_session("s1")
+
+        assert self.session_service.get_session("s1") is context
+        assert context["conversation_history"] == []
+
+    def test_get_expired_session_returns_none(self):
+        """Testa que sessão expirada é descartada no acesso."""
+        with patch("src.services.session_service.time.time", return_value=1000.0):
+            self.session_service.create_session("s1")
+        with patch("src.services.session_service.time.time", return_value=1101.0):
+            assert self.session_service.get_session("s1") is None
+            assert self.session_service.list_sessions() == {}
+
+    def test_update_session_renews_ttl(self):
+        """Testa que escrita na sessão renova o TTL."""
+        with patch("src.services.session_service.time.time", return_value=1000.0):
+            context = self.session_service.create_session("s1")
+        with patch("src.services.session_service.time.time", return_value=1090.0):
+            self.session_service.update_session("s1", context)
+        with patch("src.services.session_service.time.time", return_value=1150.0):
+            assert self.session_service.get_session("s1") is context
+
+    def test_delete_session(self):
+        """Testa remoção de sessão."""
+        self.session_service.create_session("s1")
+        self.session_service.delete_session("s1")
+
+        assert self.session_service.get_session("s1") is None
+
+    def test_cleanup_old_sessions(self):
+        """Testa limpeza apenas das sessões expiradas."""
+        with patch("src.services.session_service.time.time", return_value=1000.0):
+            self.session_service.create_session("old")
+        with patch("src.services.session_service.time.time", return_value=1050.0):
+            self.session_service.create_session("new")
+        with patch("src.services.session_service.time.time", return_value=1120.0):
+            removed = self.session_service.cleanup_old_sessions()
+            assert removed == 1
+            assert list(self.session_service.list_sessions()) == ["new"]
+
+    def test_cleanup_keeps_renewed_sessions(self):
+        """Testa que sessão com TTL renovado é reagendada, não removida."""
+        with patch("src.services.session_service.time.time", return_value=1000.0):
+            context = self.session_service.create_session("s1")
+        with patch("src.services.session_service.time.time", return_value=1090.0):
+            self.session_service.update_session("s1", context)
+        with patch("src.services.session_service.time.time", return_value=1120.0):
+            assert self.session_service.cleanup_old_sessions() == 0
+        with patch("src.services.session_service.time.time", return_value=1200.0):
+            assert self.session_service.cleanup_old_sessions() == 1
+            assert self.session_service.list_sessions() == {}
+
+    def test_summary_tracks_updates(self):
+        """Testa que o resumo da sessão é atualizado a cada escrita."""
+        context = self.session_service.create_session("s1")
+        context["conversation_history"].append({"user_message": "Olá"})
+        context["extracted_data"]["name"] = "João"
+        context["average_confidence"] = 0.8
+        self.session_service.update_session("s1", context)
+
+        summaries = self.session_service.list_summaries()
+
+        assert len(summaries) == 1
+        assert summaries[0].session_id == "s1"
+        assert summaries[0].total_messages == 1
+        assert summaries[0].extracted_fields == ("name",)
+        assert summaries[0].average_confidence == 0.8
+
+    def test_summary_removed_with_session(self):
+        """Testa que o resumo é descartado junto com a sessão."""
+        self.session_service.create_session("s1")
+        self.session_service.delete_session("s1")
+
+        assert self.session_service.list_summaries() == []
+
+    def test_list_summaries_pagination(self):
+        """Testa a paginação dos resumos com offset e limit."""
+        for session_id in ("s1", "s2", "s3"):
+            self.session_service.create_session(session_id)
+
+        page = self.session_service.list_summaries(offset=1, limit=1)
+
+        assert [summary.session_id for summary in page] == ["s2"]
+        assert len(self.session_service.list_summaries(offset=2)) == 1
+
+    def test_page_summaries_total_excludes_expired(self):
+        """Testa que o total paginado desconta sessões expiradas ainda não limpas."""
+        service = SessionService(ttl_seconds=100)
+        with patch("src.services.session_service.time.time", return_value=1000.0):
+            service.create_session("s1")
+        with patch("src.services.session_service.time.time", return_value=1050.0):
+            service.create_session("s2")
+            service.create_session("s3")
+
+        with patch("src.services.session_service.time.time", return_value=1120.0):
+            page, total = service.page_summaries(offset=0, limit=1)
+
+        assert total == 2
+        assert [summary.session_id for summary in page] == ["s2"]
+
+    def test_capacity_evicts_least_recently_written(self):
+        """Testa que o limite de capacidade descarta a sessão escrita há mais tempo."""
+        service = SessionService(ttl_seconds=100, max_sessions=2)
+        first = service.create_session("s1")
+        service.create_session("s2")
+        service.update_session("s1", first)
+        service.create_session("s3")
+
+        assert service.get_session("s2") is None
+        assert service.get_session("s1") is first
+        assert set(service.list_sessions()) == {"s1", "s3"}
+
+    def test_capacity_keeps_recently_read_session(self):
+        """Testa que ler uma sessão a protege do descarte por capacidade."""
+        service = SessionService(ttl_seconds=100, max_sessions=2)
+        first = service.create_session("s1")
+        service.create_session("s2")
+        service.get_session("s1")
+        service.create_session("s3")
+
+        assert service.get_session("s2") is None
+        assert service.get_session("s1") is first
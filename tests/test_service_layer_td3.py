@@ -9,7 +9,7 @@ This test suite validates the service layer improvements including:
 """
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from src.core.container import ServiceContainer, get_chat_service, get_validation_service, get_extraction_service, get_session_service
 
 
@@ -36,7 +36,27 @@ class TestServiceLayerArchitecture:
         chat_service = container.get_service('chat_service')
         assert container.is_initialized('chat_service')
         assert chat_service is not None
-    
+
+    def test_service_container_builds_only_requested_dependencies(self):
+        """Test that getting one service does not construct unrelated ones."""
+        container = ServiceContainer()
+        container.clear_services()
+
+        container.get_service('validation_service')
+        assert not container.is_initialized('openai_client')
+        assert not container.is_initialized('chat_service')
+
+        container.get_service('extraction_service')
+        assert container.is_initialized('entity_extractor')
+        assert container.is_initialized('openai_client')
+        assert not container.is_initialized('reasoning_coordinator')
+        container.clear_services()
+
+    def test_service_container_unknown_service(self):
+        """Test that unknown service names raise KeyError."""
+        with pytest.raises(KeyError):
+            ServiceContainer().get_service('unknown_service')
+
     def test_dependency_injection_consistency(self):
         """Test that services use proper dependency injection."""
         container = ServiceContainer()
@@ -142,7 +162,24 @@ class TestServiceLayerArchitecture:
         # Clear services
         container.clear_services()
         assert not container.is_initialized('validation_service')
-    
+
+    @pytest.mark.asyncio
+    async def test_service_container_aclose(self):
+        """Test shutdown flushes the consultation writer and closes the HTTP client."""
+        container = ServiceContainer()
+        container.clear_services()
+
+        consultation_service = Mock()
+        consultation_service.writer.close = AsyncMock()
+        container.register_service('consultation_service', consultation_service)
+
+        with patch('src.core.container.close_http_client', new_callable=AsyncMock) as mock_close:
+            await container.aclose()
+
+        consultation_service.writer.close.assert_awaited_once()
+        mock_close.assert_awaited_once()
+        container.clear_services()
+
     @pytest.mark.asyncio
     async def test_extraction_service_context_awareness(self):
         """Test ExtractionService context enhancement."""